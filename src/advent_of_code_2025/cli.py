@@ -1,23 +1,60 @@
 """CLI for Advent of Code 2025."""
 
+import importlib
+from typing import Any
+
 import typer
-from rich.console import Console
+from typer.core import TyperGroup
+
+# Commands are imported only when invoked: name -> (module, function, help)
+LAZY_COMMANDS: dict[str, tuple[str, str, str]] = {
+    "new": ("advent_of_code_2025.commands.new", "new_day", "📝 Scaffold a new day's solution"),
+    "run": ("advent_of_code_2025.commands.run", "run_day", "🚀 Run solution for a specific day"),
+    "bench": ("advent_of_code_2025.commands.bench", "bench_day", "⏱️  Benchmark solution for a specific day"),
+    "status": ("advent_of_code_2025.commands.status", "show_status", "📊 Show completion progress"),
+    "history": ("advent_of_code_2025.commands.history", "show_history", "📜 Compare results with previous runs"),
+    "gen": ("advent_of_code_2025.commands.gen", "gen_input", "🎲 Generate a synthetic input for a day"),
+    "scale": ("advent_of_code_2025.commands.scale", "scale_day", "📈 Measure how a solution scales with input size"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Command group that imports a command's module only when the command is looked up."""
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        return [*super().list_commands(ctx), *LAZY_COMMANDS]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        if cmd_name not in LAZY_COMMANDS:
+            return super().get_command(ctx, cmd_name)
+
+        module_name, function_name, help_text = LAZY_COMMANDS[cmd_name]
+        function = getattr(importlib.import_module(module_name), function_name)
+        command_app = typer.Typer(add_completion=False, rich_markup_mode="rich")
+        command_app.command(name=cmd_name, help=help_text)(function)
+        return typer.main.get_command(command_app)
 
-from advent_of_code_2025.commands import new, run, status
 
 app = typer.Typer(
     name="aoc",
     help="🎄 Advent of Code 2025 CLI",
     add_completion=False,
     rich_markup_mode="rich",
+    cls=LazyGroup,
 )
 
-console = Console()
 
-# Register commands
-app.command(name="new", help="📝 Scaffold a new day's solution")(new.new_day)
-app.command(name="run", help="🚀 Run solution for a specific day")(run.run_day)
-app.command(name="status", help="📊 Show completion progress")(status.show_status)
+@app.callback()
+def main(
+    profile_import: bool = typer.Option(
+        False, "--profile-import", help="Show where the command's import time is spent (like python -X importtime)"
+    ),
+) -> None:
+    """🎄 Advent of Code 2025 CLI"""
+    if profile_import:
+        from advent_of_code_2025.commands.profile_import import profile_command
+
+        raise typer.Exit(profile_command())
 
 
 if __name__ == "__main__":
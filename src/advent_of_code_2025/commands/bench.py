@@ -0,0 +1,194 @@
+"""Command to benchmark a day's solution."""
+
+import gc
+import inspect
+import math
+import statistics
+import time
+from collections.abc import Callable
+from functools import partial
+from typing import Any, NamedTuple
+
+import typer
+from rich.table import Table
+
+from advent_of_code_2025.commands.common import (
+    console,
+    get_part_function,
+    get_solver,
+    hash_input,
+    load_day_module,
+    load_input,
+)
+from advent_of_code_2025.commands.history import HistoryEntry, git_revision, record_results
+
+
+class TimingStats(NamedTuple):
+    rounds: int
+    minimum: float
+    median: float
+    p95: float
+    mean: float
+    stddev: float
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> "TimingStats":
+        """Summarise a list of timings (in seconds)."""
+        if not samples:
+            raise ValueError()
+        ordered = sorted(samples)
+        p95_rank = math.ceil(0.95 * len(ordered)) - 1
+        return cls(
+            rounds=len(ordered),
+            minimum=ordered[0],
+            median=statistics.median(ordered),
+            p95=ordered[p95_rank],
+            mean=statistics.fmean(ordered),
+            stddev=statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        )
+
+
+def time_calls(
+    func: Callable[..., Any], *args: Any, rounds: int, warmup: int = 0, disable_gc: bool = True
+) -> tuple[Any, list[float]]:
+    """Call `func(*args)` repeatedly and return its last result with the timing of each timed round.
+
+    Warmup rounds are executed but not timed. When `disable_gc` is set, a full collection runs
+    before every round and the garbage collector stays disabled while the call is being timed.
+    """
+    result = None
+    for _ in range(warmup):
+        result = func(*args)
+
+    samples: list[float] = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(rounds):
+            if disable_gc:
+                gc.collect()
+                gc.disable()
+            start_time = time.perf_counter()
+            result = func(*args)
+            samples.append(time.perf_counter() - start_time)
+            if disable_gc and gc_was_enabled:
+                gc.enable()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return result, samples
+
+
+def with_workers(func: Callable[..., Any], workers: int | None) -> Callable[..., Any] | None:
+    """Bind the number of worker processes of a solution, or get None if it does not take `workers`."""
+    if workers is None:
+        return func
+    if "workers" not in inspect.signature(func).parameters:
+        return None
+    return partial(func, workers=workers)
+
+
+def format_seconds(seconds: float) -> str:
+    """Format a duration using the most readable unit."""
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.3f}s"
+
+
+def _add_stats_row(table: Table, name: str, stats: TimingStats, result: str = "") -> None:
+    table.add_row(
+        name,
+        result,
+        format_seconds(stats.minimum),
+        format_seconds(stats.median),
+        format_seconds(stats.p95),
+        format_seconds(stats.stddev),
+    )
+
+
+def bench_day(
+    day: int = typer.Argument(..., help="Day number (1-25)", min=1, max=25),
+    part: int | None = typer.Option(None, "--part", "-p", help="Benchmark only specific part (1 or 2)", min=1, max=2),
+    example: bool = typer.Option(False, "--example", "-e", help="Use example input instead of puzzle input"),
+    rounds: int = typer.Option(20, "--rounds", "-n", help="Number of timed rounds", min=1),
+    warmup: int = typer.Option(2, "--warmup", "-w", help="Number of untimed warmup rounds", min=0),
+    keep_gc: bool = typer.Option(False, "--gc", help="Keep the garbage collector enabled while timing"),
+    record: bool = typer.Option(True, "--record/--no-record", help="Append the median times to the history file"),
+    workers: int | None = typer.Option(
+        None, "--workers", "-j", help="Worker processes for the solutions that can use them", min=1
+    ),
+) -> None:
+    """Benchmark the solution for a specific day."""
+    module = load_day_module(day)
+    input_data = load_input(day, example)
+
+    parts_to_run = [part] if part else [1, 2]
+
+    console.print(
+        f"\n[bold cyan]⏱️  Day {day}[/bold cyan]"
+        + (" [dim](example)[/dim]" if example else "")
+        + f" [dim]{rounds} rounds, {warmup} warmup, gc {'on' if keep_gc else 'off'}"
+        + (f", {workers} workers" if workers else "")
+        + "[/dim]"
+    )
+
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Step", style="cyan")
+    table.add_column("Answer", justify="right")
+    for column in ("Min", "Median", "P95", "Std dev"):
+        table.add_column(column, justify="right")
+
+    entries: list[HistoryEntry] = []
+    parsed = None
+    parse_input = getattr(module, "parse_input", None)
+    if parse_input is not None:
+        try:
+            parsed, samples = time_calls(parse_input, input_data, rounds=rounds, warmup=warmup, disable_gc=not keep_gc)
+        except Exception as e:
+            console.print(f"[red]   parse_input: ❌ Error: {e}[/red]")
+            parse_input = None
+        else:
+            _add_stats_row(table, "parse_input", TimingStats.from_samples(samples))
+
+    for part_num in parts_to_run:
+        func = get_part_function(module, part_num)
+        if func is None:
+            console.print(f"[yellow]⚠️  Part {part_num} not implemented[/yellow]")
+            continue
+
+        # Days with a solver are timed on the input parsed above, the others on the raw input
+        solver = get_solver(module, part_num) if parse_input is not None else None
+        step, func, argument = (
+            (f"solve_part{part_num}", solver, parsed) if solver is not None else (f"part{part_num}", func, input_data)
+        )
+        func = with_workers(func, workers)
+        if func is None:
+            console.print(f"[yellow]⚠️  Part {part_num} does not use worker processes[/yellow]")
+            continue
+        try:
+            result, samples = time_calls(func, argument, rounds=rounds, warmup=warmup, disable_gc=not keep_gc)
+        except Exception as e:
+            console.print(f"[red]   Part {part_num}: ❌ Error: {e}[/red]")
+            continue
+
+        stats = TimingStats.from_samples(samples)
+        _add_stats_row(table, step, stats, result=str(result))
+        entries.append(
+            HistoryEntry(
+                day=day,
+                part=part_num,
+                answer=str(result),
+                seconds=stats.median,
+                input_hash=hash_input(input_data),
+                example=example,
+                source="bench" if workers is None else f"bench -j{workers}",
+            )
+        )
+
+    if record:
+        revision = git_revision()
+        record_results(entry._replace(revision=revision) for entry in entries)
+
+    console.print(table)
+    console.print()
@@ -0,0 +1,81 @@
+"""Content-addressed cache of puzzle answers."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+from advent_of_code_2025.commands.common import PROJECT_ROOT, SRC_DIR
+
+CACHE_DIR = PROJECT_ROOT / ".aoc" / "cache"
+MAX_CACHE_ENTRIES = 256
+
+
+class CachedAnswer(NamedTuple):
+    answer: str
+    seconds: float
+
+
+def solution_sources(day: int) -> list[Path]:
+    """Get the source files of the package that make up the solution of a day, sorted."""
+    day_file = SRC_DIR / f"day{day:02d}.py"
+    return sorted(
+        source_file
+        for source_file in SRC_DIR.rglob("*.py")
+        if source_file.relative_to(SRC_DIR).parts[0] != "commands"
+        and (source_file == day_file or not source_file.match("day[0-9][0-9].py"))
+    )
+
+
+def answer_key(day: int, part: int, input_hash: str) -> str:
+    """Build the cache key of an answer from the solution source, the input's hash and the part.
+
+    Every module of the package a solution may import is part of its source: all of them except the
+    other days and the CLI commands.
+    """
+    digest = hashlib.sha256()
+    for source_file in solution_sources(day):
+        digest.update(f"{source_file.relative_to(SRC_DIR).as_posix()}\0".encode())
+        digest.update(source_file.read_bytes())
+    digest.update(f"\0{input_hash}\0part{part}".encode())
+    return digest.hexdigest()
+
+
+def get_answer(key: str) -> CachedAnswer | None:
+    """Get a cached answer, or None on a cache miss."""
+    cache_file = CACHE_DIR / f"{key}.json"
+    try:
+        cached = CachedAnswer(**json.loads(cache_file.read_text()))
+    except (OSError, ValueError, TypeError):
+        return None
+    # Refresh the modification time so eviction drops the least recently used entries first
+    cache_file.touch()
+    return cached
+
+
+def store_answer(key: str, answer: str, seconds: float, max_entries: int = MAX_CACHE_ENTRIES) -> None:
+    """Cache an answer, evicting the least recently used entries above `max_entries`."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file = CACHE_DIR / f"{key}.json"
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    tmp_file.write_text(json.dumps(CachedAnswer(answer=answer, seconds=seconds)._asdict()))
+    tmp_file.replace(cache_file)
+    evict(max_entries)
+
+
+def evict(max_entries: int = MAX_CACHE_ENTRIES) -> int:
+    """Remove the least recently used entries above `max_entries` and return how many were removed."""
+    if not CACHE_DIR.exists():
+        return 0
+    entries = []
+    for cache_file in CACHE_DIR.glob("*.json"):
+        try:
+            entries.append((cache_file.stat().st_mtime_ns, cache_file))
+        except FileNotFoundError:
+            continue
+    entries.sort(reverse=True)
+    stale = entries[max_entries:]
+    for _, cache_file in stale:
+        cache_file.unlink(missing_ok=True)
+    return len(stale)
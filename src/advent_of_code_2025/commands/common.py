@@ -0,0 +1,120 @@
+"""Helpers shared by the CLI commands."""
+
+import hashlib
+import importlib
+import mmap
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from types import ModuleType
+
+import typer
+from rich.console import Console
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+SRC_DIR = PROJECT_ROOT / "src" / "advent_of_code_2025"
+
+console = Console()
+
+
+def load_day_module(day: int) -> ModuleType:
+    """Import the solution module for a day, exiting the CLI if it does not exist."""
+    try:
+        return importlib.import_module(f"advent_of_code_2025.day{day:02d}")
+    except ModuleNotFoundError as e:
+        console.print(f"[red]❌ Day {day} not found. Run 'aoc new {day}' to create it.[/red]")
+        raise typer.Exit(1) from e
+
+
+def get_input_file(day: int, example: bool = False) -> Path:
+    """Get the path of the puzzle (or example) input file for a day."""
+    suffix = "_example" if example else ""
+    return PROJECT_ROOT / "inputs" / f"day{day:02d}{suffix}.txt"
+
+
+def require_input_file(day: int, example: bool = False) -> Path:
+    """Get the path of the input file for a day, exiting the CLI if it does not exist."""
+    input_file = get_input_file(day, example)
+
+    if not input_file.exists():
+        console.print(f"[red]❌ Input file not found: {input_file}[/red]")
+        raise typer.Exit(1)
+
+    return input_file
+
+
+def load_input(day: int, example: bool = False) -> str:
+    """Read the input file for a day, exiting the CLI if it does not exist."""
+    input_data = require_input_file(day, example).read_text()
+
+    if not input_data.strip():
+        console.print("[yellow]⚠️  Warning: Input file is empty[/yellow]")
+
+    return input_data
+
+
+def get_part_function(module: ModuleType, part: int) -> Callable | None:
+    """Get the `partN` function of a day module, or None if it is not defined."""
+    return getattr(module, f"part{part}", None)
+
+
+def get_solver(module: ModuleType, part: int) -> Callable | None:
+    """Get the `solve_partN` function of a day module, or None if it is not defined.
+
+    Solvers take the output of the module's `parse_input` instead of the raw input, so one parsed
+    input can be shared by both parts. They must not modify the parsed input.
+    """
+    if not hasattr(module, "parse_input"):
+        return None
+    return getattr(module, f"solve_part{part}", None)
+
+
+def hash_input(input_data: str) -> str:
+    """Get a short content hash of an input."""
+    return hashlib.sha256(input_data.encode()).hexdigest()[:16]
+
+
+def hash_input_file(input_file: Path, chunk_size: int = 1 << 20) -> str:
+    """Get the same hash as `hash_input` for an input file, without reading it into memory at once.
+
+    The file is read in text mode like `Path.read_text` does, so Windows line endings are normalised and
+    the hash matches the one of the file's contents.
+    """
+    digest = hashlib.sha256()
+    with input_file.open() as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk.encode())
+    return digest.hexdigest()[:16]
+
+
+def iter_input_lines(input_file: Path, use_mmap: bool = False) -> Iterator[str]:
+    """Lazily yield the lines of an input file, without their line endings.
+
+    Lines are read through a buffered file by default, or from a memory map of the file when
+    `use_mmap` is set. Either way only the current line is held in memory.
+    """
+    if not use_mmap:
+        with input_file.open() as f:
+            for line in f:
+                yield line.rstrip("\r\n")
+        return
+
+    if input_file.stat().st_size == 0:
+        # Empty files cannot be memory mapped
+        return
+    with input_file.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        for line in iter(mapped.readline, b""):
+            yield line.decode().rstrip("\r\n")
+
+
+def get_line_parser(module: ModuleType) -> Callable | None:
+    """Get the `parse_lines` function of a day module, or None if it is not defined.
+
+    `parse_lines` takes an iterable of input lines and returns a value the day's solvers accept, like
+    `parse_input` does, but it may consume the lines lazily so it can be fed a stream over the input file.
+    """
+    return getattr(module, "parse_lines", None)
+
+
+def discover_days() -> list[int]:
+    """Get the numbers of all days that have a solution file."""
+    return sorted(int(day_file.stem.replace("day", "")) for day_file in SRC_DIR.glob("day[0-9][0-9].py"))
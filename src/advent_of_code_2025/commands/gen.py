@@ -0,0 +1,30 @@
+"""Command to generate synthetic puzzle inputs."""
+
+import sys
+from pathlib import Path
+
+import typer
+
+from advent_of_code_2025.commands.common import console
+from advent_of_code_2025.generators import GENERATORS, generate_input
+
+
+def gen_input(
+    day: int = typer.Argument(..., help="Day number (1-25)", min=1, max=25),
+    size: int = typer.Option(1000, "--size", "-n", help="Input size (records, or side length for grids)", min=1),
+    seed: int = typer.Option(0, "--seed", "-s", help="Random seed, the same seed always gives the same input"),
+    output: Path | None = typer.Option(None, "--output", "-o", help="File to write to (default: stdout)"),  # noqa: B008
+) -> None:
+    """Generate a synthetic input for a day."""
+    if day not in GENERATORS:
+        console.print(f"[red]❌ No input generator for day {day}[/red]")
+        raise typer.Exit(1)
+
+    input_data = generate_input(day, size, seed)
+    if output is None:
+        sys.stdout.write(input_data)
+        return
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(input_data)
+    console.print(f"[green]✨ Wrote {len(input_data.splitlines())} lines to {output}[/green]")
@@ -0,0 +1,162 @@
+"""Command to show the history of recorded results."""
+
+import json
+import subprocess
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import NamedTuple
+
+import typer
+from rich.table import Table
+
+from advent_of_code_2025.commands.common import PROJECT_ROOT, console
+
+HISTORY_FILE = PROJECT_ROOT / ".aoc" / "history.jsonl"
+# Slowdowns smaller than this are timer noise, whatever their ratio
+MIN_REGRESSION_SECONDS = 1e-3
+
+
+class HistoryEntry(NamedTuple):
+    day: int
+    part: int
+    answer: str
+    seconds: float
+    input_hash: str
+    revision: str = ""
+    example: bool = False
+    source: str = "run"
+    timestamp: str = ""
+
+    @property
+    def key(self) -> tuple[int, int, bool, str, str]:
+        """Entries with the same key are comparable with each other."""
+        return (self.day, self.part, self.example, self.input_hash, self.source)
+
+
+class Comparison(NamedTuple):
+    previous: HistoryEntry
+    latest: HistoryEntry
+
+    @property
+    def answer_changed(self) -> bool:
+        return self.previous.answer != self.latest.answer
+
+    @property
+    def ratio(self) -> float:
+        """How many times slower the latest run is compared to the previous one."""
+        if self.previous.seconds <= 0:
+            return 1.0
+        return self.latest.seconds / self.previous.seconds
+
+    def is_regression(self, threshold: float) -> bool:
+        """Check if the latest run is slower than the previous one by at least `threshold` times."""
+        slowdown = self.latest.seconds - self.previous.seconds
+        return self.ratio >= threshold and slowdown >= MIN_REGRESSION_SECONDS
+
+
+def git_revision() -> str:
+    """Get the current git revision, marked as dirty when there are uncommitted changes."""
+    try:
+        completed = subprocess.run(
+            ["git", "describe", "--always", "--dirty"],  # noqa: S607
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return completed.stdout.strip() or "unknown"
+
+
+def record_results(entries: Iterable[HistoryEntry]) -> None:
+    """Append entries to the history file."""
+    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    lines = [json.dumps(entry._replace(timestamp=entry.timestamp or timestamp)._asdict()) for entry in entries]
+    if not lines:
+        return
+    HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with HISTORY_FILE.open("a") as history_file:
+        history_file.write("\n".join(lines) + "\n")
+
+
+def load_history() -> list[HistoryEntry]:
+    """Read every entry of the history file, oldest first.
+
+    Lines that are not a valid entry, like a line cut short by an interrupted write or one recorded
+    in another format, are skipped.
+    """
+    if not HISTORY_FILE.exists():
+        return []
+    entries = []
+    for line in HISTORY_FILE.read_text().splitlines():
+        if not line.strip():
+            continue
+        try:
+            entries.append(HistoryEntry(**json.loads(line)))
+        except (ValueError, TypeError):
+            continue
+    return entries
+
+
+def compare_latest(entries: list[HistoryEntry]) -> list[Comparison]:
+    """Compare the latest entry of every key with the entry recorded before it."""
+    previous: dict[tuple, HistoryEntry] = {}
+    latest: dict[tuple, HistoryEntry] = {}
+    for entry in entries:
+        if entry.key in latest:
+            previous[entry.key] = latest[entry.key]
+        latest[entry.key] = entry
+    return [Comparison(previous=previous[key], latest=latest[key]) for key in sorted(previous)]
+
+
+def show_history(
+    day: int | None = typer.Argument(None, help="Only show this day", min=1, max=25),
+    threshold: float = typer.Option(1.5, "--threshold", "-t", help="Slowdown ratio flagged as a regression", min=1.0),
+) -> None:
+    """Compare the latest recorded results with the previous ones."""
+    entries = [entry for entry in load_history() if day is None or entry.day == day]
+    if not entries:
+        console.print("[yellow]No history recorded yet. Run 'aoc run' or 'aoc bench' first![/yellow]")
+        return
+
+    table = Table(title="📜 Result history", show_header=True, header_style="bold cyan")
+    table.add_column("Day", style="cyan")
+    table.add_column("Part", justify="center")
+    table.add_column("Source")
+    table.add_column("Revision")
+    table.add_column("Answer", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Status")
+
+    comparisons = compare_latest(entries)
+    if not comparisons:
+        console.print("[yellow]Nothing to compare yet, every result has been recorded only once.[/yellow]")
+        return
+
+    flagged = 0
+    for comparison in comparisons:
+        previous, latest = comparison.previous, comparison.latest
+        status = []
+        if comparison.answer_changed:
+            status.append("[red]answer changed[/red]")
+        if comparison.is_regression(threshold):
+            status.append(f"[red]{comparison.ratio:.1f}x slower[/red]")
+        flagged += bool(status)
+
+        answer = latest.answer if not comparison.answer_changed else f"{previous.answer} → {latest.answer}"
+        source = latest.source + (" (example)" if latest.example else "")
+        table.add_row(
+            f"Day {latest.day}",
+            str(latest.part),
+            source,
+            latest.revision if latest.revision == previous.revision else f"{previous.revision} → {latest.revision}",
+            answer,
+            f"{previous.seconds:.4f}s → {latest.seconds:.4f}s",
+            ", ".join(status) or "[green]ok[/green]",
+        )
+
+    console.print()
+    console.print(table)
+    console.print(f"\n[bold]{flagged} flagged[/bold] [dim](regression threshold {threshold:.1f}x)[/dim]")
+    console.print()
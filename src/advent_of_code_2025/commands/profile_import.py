@@ -0,0 +1,78 @@
+"""Profile the import time of a CLI invocation."""
+
+import os
+import subprocess
+import sys
+from typing import NamedTuple
+
+from rich.table import Table
+
+from advent_of_code_2025.commands.common import console
+
+
+class ImportTiming(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> tuple[list[ImportTiming], list[str]]:
+    """Split `-X importtime` output into import timings and the remaining stderr lines."""
+    timings: list[ImportTiming] = []
+    other_lines: list[str] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            other_lines.append(line)
+            continue
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # Header line
+            continue
+        self_us, cumulative_us, name = fields
+        depth = (len(name) - len(name.lstrip())) // 2
+        timings.append(ImportTiming(name.strip(), int(self_us), int(cumulative_us), depth))
+    return timings, other_lines
+
+
+def profile_command(top: int = 25) -> int:
+    """Re-run the current command with `-X importtime` and show its slowest imports.
+
+    The command's own output is passed through unchanged and its exit code is returned.
+    """
+    args = [arg for arg in sys.argv[1:] if arg != "--profile-import"]
+    env = {**os.environ, "COLUMNS": str(console.width)}
+    if console.is_terminal:
+        env["FORCE_COLOR"] = "1"
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-m", "advent_of_code_2025.cli", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    sys.stdout.write(completed.stdout)
+    timings, other_lines = parse_importtime(completed.stderr)
+    if other_lines:
+        sys.stderr.write("\n".join(other_lines) + "\n")
+
+    total_us = sum(timing.self_us for timing in timings)
+    table = Table(title=f"📦 Slowest imports (top {top})", show_header=True, header_style="bold cyan")
+    table.add_column("Module", style="cyan")
+    table.add_column("Self", justify="right")
+    table.add_column("Cumulative", justify="right")
+    table.add_column("Share", justify="right")
+    for timing in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        share = timing.cumulative_us / total_us if total_us else 0.0
+        table.add_row(
+            "  " * timing.depth + timing.module,
+            f"{timing.self_us / 1e3:.1f}ms",
+            f"{timing.cumulative_us / 1e3:.1f}ms",
+            f"{share:.0%}",
+        )
+
+    console.print()
+    console.print(table)
+    console.print(f"\n[bold]{len(timings)} modules imported in {total_us / 1e3:.1f}ms[/bold]")
+    console.print()
+    return completed.returncode
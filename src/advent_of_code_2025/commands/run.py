@@ -1,68 +1,308 @@
 """Command to run a day's solution."""
 
 import importlib
+import os
 import time
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from types import ModuleType
+from typing import Any, NamedTuple
 
 import typer
-from rich.console import Console
+from rich.table import Table
 
-console = Console()
+from advent_of_code_2025.commands import cache
+from advent_of_code_2025.commands.common import (
+    console,
+    discover_days,
+    get_input_file,
+    get_line_parser,
+    get_part_function,
+    get_solver,
+    hash_input,
+    hash_input_file,
+    iter_input_lines,
+    load_day_module,
+    load_input,
+    require_input_file,
+)
+from advent_of_code_2025.commands.history import HistoryEntry, git_revision, record_results
+
+
+class PartResult(NamedTuple):
+    day: int
+    part: int
+    result: str | None = None
+    elapsed: float = 0.0
+    error: str | None = None
+    input_hash: str = ""
+    cached: bool = False
+    parse_elapsed: float = 0.0
+
+
+class DayRunner:
+    """Runs the parts of a day on one input.
+
+    Days that expose `solve_partN` get their input parsed once, timed on its own, and the parsed
+    value is shared by both parts. Other days have `partN` called with the raw input.
+    """
+
+    def __init__(self, day: int, module: ModuleType, input_data: str, use_cache: bool = True) -> None:
+        self.day = day
+        self.module = module
+        self.input_data = input_data
+        self.use_cache = use_cache
+        self.input_hash = hash_input(input_data)
+        self.is_parsed = False
+        self.parse_elapsed = 0.0
+        self._parsed: Any = None
+
+    def parsed(self) -> Any:
+        """Get the parsed input, parsing it on first use."""
+        if not self.is_parsed:
+            start_time = time.perf_counter()
+            self._parsed = self.module.parse_input(self.input_data)
+            self.parse_elapsed = time.perf_counter() - start_time
+            self.is_parsed = True
+        return self._parsed
+
+    def solve(self, part: int, func: Callable) -> tuple[Any, float, float]:
+        """Compute a part and return its answer, solve time and parse time."""
+        solver = get_solver(self.module, part)
+        if solver is None:
+            start_time = time.perf_counter()
+            result = func(self.input_data)
+            return result, time.perf_counter() - start_time, 0.0
+
+        parsed = self.parsed()
+        start_time = time.perf_counter()
+        result = solver(parsed)
+        return result, time.perf_counter() - start_time, self.parse_elapsed
+
+    def run(self, part: int) -> PartResult | None:
+        """Solve one part, or return None if it is not implemented.
+
+        The cached answer is reused when neither the solution nor the input changed.
+        """
+        func = get_part_function(self.module, part)
+        if func is None:
+            return None
+
+        key = cache.answer_key(self.day, part, self.input_hash) if self.use_cache else None
+        if key is not None and (cached := cache.get_answer(key)) is not None:
+            return PartResult(
+                day=self.day,
+                part=part,
+                result=cached.answer,
+                elapsed=cached.seconds,
+                input_hash=self.input_hash,
+                cached=True,
+            )
+
+        try:
+            result, elapsed, parse_elapsed = self.solve(part, func)
+        except Exception as e:
+            return PartResult(day=self.day, part=part, error=str(e), input_hash=self.input_hash)
+
+        if key is not None:
+            cache.store_answer(key, str(result), elapsed + parse_elapsed)
+        return PartResult(
+            day=self.day,
+            part=part,
+            result=str(result),
+            elapsed=elapsed,
+            input_hash=self.input_hash,
+            parse_elapsed=parse_elapsed,
+        )
+
+
+class StreamingDayRunner(DayRunner):
+    """Runs the parts of a day without reading the whole input file into memory.
+
+    Days that expose `parse_lines` and `solve_partN` get a fresh line stream over the input file for
+    every part, so parsing is interleaved with solving. Other days fall back to reading the file.
+    """
+
+    def __init__(
+        self, day: int, module: ModuleType, input_file: Path, use_cache: bool = True, use_mmap: bool = False
+    ) -> None:
+        super().__init__(day, module, "", use_cache)
+        self.input_file = input_file
+        self.use_mmap = use_mmap
+        self.input_hash = hash_input_file(input_file)
+
+    def solve(self, part: int, func: Callable) -> tuple[Any, float, float]:
+        parse_lines = get_line_parser(self.module)
+        solver = get_solver(self.module, part)
+        if parse_lines is None or solver is None:
+            if not self.input_data:
+                self.input_data = self.input_file.read_text()
+            return super().solve(part, func)
+
+        start_time = time.perf_counter()
+        result = solver(parse_lines(iter_input_lines(self.input_file, self.use_mmap)))
+        return result, time.perf_counter() - start_time, 0.0
+
+
+def execute_part(
+    day: int, part: int, example: bool = False, use_cache: bool = True, stream: bool = False, use_mmap: bool = False
+) -> PartResult:
+    """Load and solve one part of a day.
+
+    Unlike `run_day` this never exits the CLI, so it can be used from worker processes.
+    """
+    try:
+        module = importlib.import_module(f"advent_of_code_2025.day{day:02d}")
+        input_file = get_input_file(day, example)
+        runner = (
+            StreamingDayRunner(day, module, input_file, use_cache, use_mmap)
+            if stream
+            else DayRunner(day, module, input_file.read_text(), use_cache)
+        )
+    except (ModuleNotFoundError, FileNotFoundError) as e:
+        return PartResult(day=day, part=part, error=str(e))
+
+    part_result = runner.run(part)
+    if part_result is None:
+        return PartResult(day=day, part=part, error="not implemented")
+    return part_result
+
+
+def _history_entries(results: list[PartResult], example: bool) -> list[HistoryEntry]:
+    """Build the history entries of the results that were actually computed."""
+    revision = git_revision()
+    return [
+        HistoryEntry(
+            day=part_result.day,
+            part=part_result.part,
+            answer=part_result.result,
+            seconds=part_result.elapsed + part_result.parse_elapsed,
+            input_hash=part_result.input_hash,
+            revision=revision,
+            example=example,
+        )
+        for part_result in results
+        if part_result.result is not None and not part_result.cached
+    ]
 
 
 def run_day(
-    day: int = typer.Argument(..., help="Day number (1-25)", min=1, max=25),
+    day: int | None = typer.Argument(None, help="Day number (1-25)", min=1, max=25),
     part: int | None = typer.Option(None, "--part", "-p", help="Run only specific part (1 or 2)", min=1, max=2),
     example: bool = typer.Option(False, "--example", "-e", help="Use example input instead of puzzle input"),
+    all_days: bool = typer.Option(False, "--all", "-a", help="Run every day in parallel"),
+    workers: int | None = typer.Option(
+        None, "--workers", "-j", help="Worker processes for --all (default: CPU count)", min=1
+    ),
+    record: bool = typer.Option(True, "--record/--no-record", help="Append the results to the history file"),
+    use_cache: bool = typer.Option(True, "--cache/--no-cache", help="Reuse answers of unchanged solutions and inputs"),
+    stream: bool = typer.Option(
+        False, "--stream", "-s", help="Stream the input file line by line to days that support it"
+    ),
+    use_mmap: bool = typer.Option(False, "--mmap", help="Read streamed input through a memory map"),
 ) -> None:
     """Run solution for a specific day."""
-    day_padded = f"{day:02d}"
+    # Determine which parts to run
+    parts_to_run = [part] if part else [1, 2]
 
-    # Import the day's module
-    try:
-        module = importlib.import_module(f"advent_of_code_2025.day{day_padded}")
-    except ModuleNotFoundError as e:
-        console.print(f"[red]❌ Day {day} not found. Run 'aoc new {day}' to create it.[/red]")
-        raise typer.Exit(1) from e
-
-    # Load input data
-    project_root = Path(__file__).parent.parent.parent.parent
-    if example:
-        input_file = project_root / "inputs" / f"day{day_padded}_example.txt"
-    else:
-        input_file = project_root / "inputs" / f"day{day_padded}.txt"
+    if all_days:
+        run_all_days(parts_to_run, example, workers, record, use_cache, stream, use_mmap)
+        return
 
-    if not input_file.exists():
-        console.print(f"[red]❌ Input file not found: {input_file}[/red]")
+    if day is None:
+        console.print("[red]❌ Pass a day number or use --all[/red]")
         raise typer.Exit(1)
 
-    input_data = input_file.read_text()
-
-    if not input_data.strip():
-        console.print("[yellow]⚠️  Warning: Input file is empty[/yellow]")
-
-    # Determine which parts to run
-    parts_to_run = [part] if part else [1, 2]
+    module = load_day_module(day)
+    if stream:
+        runner: DayRunner = StreamingDayRunner(day, module, require_input_file(day, example), use_cache, use_mmap)
+    else:
+        runner = DayRunner(day, module, load_input(day, example), use_cache)
+    results: list[PartResult] = []
 
     # Run the solutions
     console.print(f"\n[bold cyan]🎄 Day {day}[/bold cyan]" + (" [dim](example)[/dim]" if example else ""))
+    if stream and get_line_parser(module) is None:
+        console.print(f"[yellow]⚠️  Day {day} does not support streaming, reading the whole input[/yellow]")
 
     for part_num in parts_to_run:
-        func_name = f"part{part_num}"
-        if not hasattr(module, func_name):
+        part_result = runner.run(part_num)
+        if part_result is None:
             console.print(f"[yellow]⚠️  Part {part_num} not implemented[/yellow]")
             continue
 
-        func: Callable = getattr(module, func_name)
+        results.append(part_result)
+        if part_result.error is not None:
+            console.print(f"[red]   Part {part_num}: ❌ Error: {part_result.error}[/red]")
+            continue
 
-        try:
-            start_time = time.perf_counter()
-            result = func(input_data)
-            elapsed = time.perf_counter() - start_time
+        timing = "cached" if part_result.cached else f"{part_result.elapsed:.4f}s"
+        console.print(f"[green]   Part {part_num}: [bold]{part_result.result}[/bold] ⭐[/green] [dim]({timing})[/dim]")
 
-            console.print(f"[green]   Part {part_num}: [bold]{result}[/bold] ⭐[/green] [dim]({elapsed:.4f}s)[/dim]")
-        except Exception as e:
-            console.print(f"[red]   Part {part_num}: ❌ Error: {e}[/red]")
+    if runner.is_parsed:
+        console.print(f"[dim]   Input parsed once in {runner.parse_elapsed:.4f}s[/dim]")
+
+    if record:
+        record_results(_history_entries(results, example))
 
     console.print()
+
+
+def _format_result(part_result: PartResult | None) -> str:
+    if part_result is None:
+        return ""
+    if part_result.error is not None:
+        return f"[red]❌ {part_result.error}[/red]"
+    timing = "cached" if part_result.cached else f"{part_result.elapsed + part_result.parse_elapsed:.4f}s"
+    return f"[green][bold]{part_result.result}[/bold][/green] [dim]({timing})[/dim]"
+
+
+def run_all_days(
+    parts_to_run: list[int],
+    example: bool,
+    workers: int | None,
+    record: bool = True,
+    use_cache: bool = True,
+    stream: bool = False,
+    use_mmap: bool = False,
+) -> None:
+    """Run every day/part in a process pool and render the results as one table."""
+    days = discover_days()
+    if not days:
+        console.print("[yellow]No solution files found. Run 'aoc new 1' to get started![/yellow]")
+        return
+
+    jobs = [(day, part_num) for day in days for part_num in parts_to_run]
+    max_workers = min(workers or os.cpu_count() or 1, len(jobs))
+
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(execute_part, day, part_num, example, use_cache, stream, use_mmap) for day, part_num in jobs
+        ]
+        results = {(job_result.day, job_result.part): job_result for job_result in (f.result() for f in futures)}
+    wall_time = time.perf_counter() - start_time
+
+    title = "🎄 Advent of Code 2025" + (" (example)" if example else "")
+    table = Table(title=title, show_header=True, header_style="bold cyan")
+    table.add_column("Day", style="cyan")
+    for part_num in parts_to_run:
+        table.add_column(f"Part {part_num}", justify="right")
+
+    for day in days:
+        table.add_row(f"Day {day}", *(_format_result(results.get((day, part_num))) for part_num in parts_to_run))
+
+    if record:
+        record_results(_history_entries(list(results.values()), example))
+
+    solve_time = sum(
+        job_result.elapsed + job_result.parse_elapsed for job_result in results.values() if not job_result.cached
+    )
+    console.print()
+    console.print(table)
+    console.print(
+        f"\n[bold]{len(jobs)} parts in {wall_time:.3f}s[/bold] "
+        f"[dim](sum of solve times {solve_time:.3f}s, {max_workers} workers)[/dim]"
+    )
+    console.print()
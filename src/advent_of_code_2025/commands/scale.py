@@ -0,0 +1,138 @@
+"""Command to measure how a day's solution scales with the input size."""
+
+import math
+import tracemalloc
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+import typer
+from rich.table import Table
+
+from advent_of_code_2025.commands.bench import format_seconds, time_calls
+from advent_of_code_2025.commands.common import console, get_part_function, load_day_module
+from advent_of_code_2025.generators import GENERATORS, generate_input
+
+
+class ScalePoint(NamedTuple):
+    size: int
+    input_bytes: int
+    seconds: float
+    peak_bytes: int | None = None
+
+
+def fit_exponent(sizes: list[int], seconds: list[float]) -> float:
+    """Fit `seconds ~ c * size^k` by least squares on a log-log scale and return `k`."""
+    if len(sizes) != len(seconds) or len(sizes) < 2:
+        raise ValueError()
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(elapsed, 1e-9)) for elapsed in seconds]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if variance == 0:
+        raise ValueError()
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys, strict=True)) / variance
+
+
+def peak_memory(func: Callable[..., Any], *args: Any) -> int:
+    """Call `func(*args)` once and return the peak memory it allocated, in bytes."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def format_bytes(n_bytes: int) -> str:
+    """Format a size in bytes using the most readable unit."""
+    if n_bytes < 1024:
+        return f"{n_bytes}B"
+    size = n_bytes / 1024
+    for unit in ("KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+
+def scale_day(
+    day: int = typer.Argument(..., help="Day number (1-25)", min=1, max=25),
+    part: int = typer.Option(1, "--part", "-p", help="Part to measure (1 or 2)", min=1, max=2),
+    start: int = typer.Option(100, "--start", help="Smallest input size", min=1),
+    factor: float = typer.Option(2.0, "--factor", "-f", help="Growth factor between sizes", min=1.1),
+    steps: int = typer.Option(6, "--steps", "-k", help="Number of sizes", min=2),
+    seed: int = typer.Option(0, "--seed", "-s", help="Random seed of the generated inputs"),
+    rounds: int = typer.Option(3, "--rounds", "-n", help="Timed rounds per size (the minimum is kept)", min=1),
+    memory: bool = typer.Option(True, "--memory/--no-memory", help="Also measure the peak memory of each size"),
+    max_seconds: float = typer.Option(
+        10.0, "--max-seconds", help="Stop growing the input once a round takes longer than this", min=0
+    ),
+) -> None:
+    """Measure how the solution for a day scales over generated inputs of growing size.
+
+    Exponents are fitted against the length of the inputs in bytes, so they compare across days.
+    """
+    if day not in GENERATORS:
+        console.print(f"[red]❌ No input generator for day {day}[/red]")
+        raise typer.Exit(1)
+
+    module = load_day_module(day)
+    func = get_part_function(module, part)
+    if func is None:
+        console.print(f"[yellow]⚠️  Part {part} not implemented[/yellow]")
+        raise typer.Exit(1)
+
+    sizes = sorted({round(start * factor**step) for step in range(steps)})
+    console.print(
+        f"\n[bold cyan]📈 Day {day} part {part}[/bold cyan] "
+        f"[dim]sizes {sizes[0]}..{sizes[-1]}, {rounds} rounds, seed {seed}[/dim]"
+    )
+
+    points: list[ScalePoint] = []
+    for size in sizes:
+        input_data = generate_input(day, size, seed)
+        try:
+            _, samples = time_calls(func, input_data, rounds=rounds)
+            peak_bytes = peak_memory(func, input_data) if memory else None
+        except Exception as e:
+            console.print(f"[red]   Size {size}: ❌ Error: {e}[/red]")
+            break
+        points.append(ScalePoint(size, len(input_data), min(samples), peak_bytes))
+        if min(samples) > max_seconds:
+            console.print(f"[dim]   Stopping after size {size}, it took over {max_seconds:g}s[/dim]")
+            break
+
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Size", justify="right", style="cyan")
+    table.add_column("Input", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Peak memory", justify="right")
+    table.add_column("Local exponent (bytes)", justify="right")
+    previous: ScalePoint | None = None
+    for point in points:
+        local = (
+            ""
+            if previous is None
+            else f"{fit_exponent([previous.input_bytes, point.input_bytes], [previous.seconds, point.seconds]):.2f}"
+        )
+        table.add_row(
+            str(point.size),
+            format_bytes(point.input_bytes),
+            format_seconds(point.seconds),
+            "" if point.peak_bytes is None else format_bytes(point.peak_bytes),
+            local,
+        )
+        previous = point
+    console.print(table)
+
+    if len(points) >= 2:
+        # What `size` counts differs between days (lines, grid side, ...), the input length does not
+        exponent = fit_exponent([point.input_bytes for point in points], [point.seconds for point in points])
+        console.print(
+            f"[bold]Empirical complexity: O(bytes^{exponent:.2f})[/bold] [dim](log-log least squares fit)[/dim]"
+        )
+    else:
+        console.print("[yellow]⚠️  Need at least two sizes to fit an exponent[/yellow]")
+    console.print()
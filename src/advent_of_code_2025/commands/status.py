@@ -1,23 +1,20 @@
 """Command to show completion status."""
 
-import importlib
-import inspect
+import ast
+import json
 from pathlib import Path
 
-from rich.console import Console
 from rich.table import Table
 
-console = Console()
+from advent_of_code_2025.commands.common import PROJECT_ROOT, SRC_DIR, console
 
+STATUS_INDEX = PROJECT_ROOT / ".aoc" / "status_index.json"
 
-def _check_part_implemented(module, part: int) -> bool:
-    """Check if a part is implemented (not just a placeholder)."""
-    func_name = f"part{part}"
-    if not hasattr(module, func_name):
-        return False
 
-    func = getattr(module, func_name)
-    source = inspect.getsource(func)
+def _check_part_implemented(source: str | None) -> bool:
+    """Check if a part is implemented (not just a placeholder), given the source of its function."""
+    if source is None:
+        return False
 
     # Check if the function just returns 0 or has TODO
     if "return 0" in source and "TODO" in source:
@@ -29,13 +26,65 @@ def _check_part_implemented(module, part: int) -> bool:
     return not (len(lines) <= 3 and "return 0" in source)
 
 
+def scan_solution_file(day_file: Path) -> tuple[bool, bool]:
+    """Check which parts of a solution file are implemented without importing it.
+
+    When a day has a `solve_partN` function, that is where the part is implemented.
+    """
+    source = day_file.read_text()
+    functions = {
+        node.name: ast.get_source_segment(source, node)
+        for node in ast.parse(source, filename=str(day_file)).body
+        if isinstance(node, ast.FunctionDef)
+    }
+    part1_source = functions.get("solve_part1", functions.get("part1"))
+    part2_source = functions.get("solve_part2", functions.get("part2"))
+    return _check_part_implemented(part1_source), _check_part_implemented(part2_source)
+
+
+class StatusIndex:
+    """On-disk index of which parts are implemented, invalidated by each file's mtime and size."""
+
+    def __init__(self, path: Path = STATUS_INDEX) -> None:
+        self.path = path
+        try:
+            self.entries: dict[str, dict] = json.loads(path.read_text())
+        except (OSError, ValueError):
+            self.entries = {}
+        self.seen: set[str] = set()
+        self.changed = False
+
+    def parts_status(self, day_file: Path) -> tuple[bool, bool]:
+        """Get which parts of a solution file are implemented, rescanning it only if it changed."""
+        stat = day_file.stat()
+        entry = self.entries.get(day_file.name)
+        if entry is None or entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            part1_done, part2_done = scan_solution_file(day_file)
+            entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "part1": part1_done, "part2": part2_done}
+            self.entries[day_file.name] = entry
+            self.changed = True
+        self.seen.add(day_file.name)
+        return entry["part1"], entry["part2"]
+
+    def save(self) -> None:
+        """Write the index back to disk, dropping files that no longer exist."""
+        stale = set(self.entries) - self.seen
+        if not self.changed and not stale:
+            return
+        for name in stale:
+            del self.entries[name]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self.entries))
+        except OSError:
+            # The index is only an optimisation, a read-only checkout still gets a status
+            return
+
+
 def show_status() -> None:
     """Show completion progress for all days."""
-    project_root = Path(__file__).parent.parent.parent.parent
-    src_dir = project_root / "src" / "advent_of_code_2025"
-
     # Find all day files
-    day_files = sorted(src_dir.glob("day*.py"))
+    day_files = sorted(SRC_DIR.glob("day*.py"))
 
     if not day_files:
         console.print("[yellow]No solution files found. Run 'aoc new 1' to get started![/yellow]")
@@ -48,28 +97,26 @@ def show_status() -> None:
     table.add_column("Part 2", justify="center", width=10)
 
     total_stars = 0
+    index = StatusIndex()
 
     for day_file in day_files:
         # Extract day number
         day_num = int(day_file.stem.replace("day", ""))
-        day_padded = f"{day_num:02d}"
 
         try:
-            module = importlib.import_module(f"advent_of_code_2025.day{day_padded}")
-
-            part1_done = _check_part_implemented(module, 1)
-            part2_done = _check_part_implemented(module, 2)
+            part1_done, part2_done = index.parts_status(day_file)
+        except (OSError, SyntaxError) as e:
+            console.print(f"[red]Error loading day {day_num}: {e}[/red]")
+            continue
 
-            part1_symbol = "⭐" if part1_done else "☆"
-            part2_symbol = "⭐" if part2_done else "☆"
+        part1_symbol = "⭐" if part1_done else "☆"
+        part2_symbol = "⭐" if part2_done else "☆"
 
-            total_stars += (1 if part1_done else 0) + (1 if part2_done else 0)
+        total_stars += (1 if part1_done else 0) + (1 if part2_done else 0)
 
-            table.add_row(f"Day {day_num}", part1_symbol, part2_symbol)
-        except Exception as e:
-            console.print(f"[red]Error loading day {day_num}: {e}[/red]")
-            continue
+        table.add_row(f"Day {day_num}", part1_symbol, part2_symbol)
 
+    index.save()
     console.print()
     console.print(table)
     console.print(f"\n[bold]Progress: {total_stars}/50 ⭐[/bold]")
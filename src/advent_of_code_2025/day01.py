@@ -1,16 +1,23 @@
-def parse_input(input_data: str) -> list[int]:
-    """Parse the input data for day 1."""
+from collections.abc import Iterable, Iterator
+
+
+def parse_lines(lines: Iterable[str]) -> Iterator[int]:
+    """Lazily parse the rotations of day 1, one line at a time."""
     direction_mapping = {"L": -1, "R": 1}
-    numbers = []
-    for line in input_data.splitlines():
+    for line in lines:
+        if not line:
+            continue
         direction, value = line[0], line[1:]
-        numbers.append(direction_mapping[direction] * int(value))
-    return numbers
+        yield direction_mapping[direction] * int(value)
 
 
-def part1(input_data: str, start: int = 50) -> int:
-    """Solve part 1 of day 1."""
-    numbers = parse_input(input_data)
+def parse_input(input_data: str) -> list[int]:
+    """Parse the input data for day 1."""
+    return list(parse_lines(input_data.splitlines()))
+
+
+def solve_part1(numbers: Iterable[int], start: int = 50) -> int:
+    """Solve part 1 of day 1 from the parsed rotations."""
     total, counter = start, 0
     for n in numbers:
         total += n
@@ -19,9 +26,8 @@ def part1(input_data: str, start: int = 50) -> int:
     return counter
 
 
-def part2(input_data: str, start: int = 50) -> int:
-    """Solve part 2 of day 1."""
-    numbers = parse_input(input_data)
+def solve_part2(numbers: Iterable[int], start: int = 50) -> int:
+    """Solve part 2 of day 1 from the parsed rotations."""
     total, counter = start, 0
     for n in numbers:
         next_total = total + n
@@ -35,3 +41,13 @@ def part2(input_data: str, start: int = 50) -> int:
             counter += next_total // 100
         total = next_total % 100
     return counter
+
+
+def part1(input_data: str, start: int = 50) -> int:
+    """Solve part 1 of day 1."""
+    return solve_part1(parse_input(input_data), start)
+
+
+def part2(input_data: str, start: int = 50) -> int:
+    """Solve part 2 of day 1."""
+    return solve_part2(parse_input(input_data), start)
@@ -39,18 +39,16 @@ def generate_pattern_repeated_numbers(
         current_pattern += 1
 
 
-def part1(input_data: str) -> int:
+def solve_part1(ranges: list[tuple[int, int]]) -> int:
     """Sum all numbers that are a pattern repeated exactly twice."""
-    ranges = parse_input(input_data)
     total = 0
     for range_start, range_end in ranges:
         total += sum(generate_pattern_repeated_numbers(range_start, range_end, repetition_count=2))
     return total
 
 
-def part2(input_data: str) -> int:
+def solve_part2(ranges: list[tuple[int, int]]) -> int:
     """Sum all numbers that are a pattern repeated two or more times."""
-    ranges = parse_input(input_data)
     total = 0
 
     for range_start, range_end in ranges:
@@ -63,3 +61,13 @@ def part2(input_data: str) -> int:
         total += sum(unique_numbers)
 
     return total
+
+
+def part1(input_data: str) -> int:
+    """Sum all numbers that are a pattern repeated exactly twice."""
+    return solve_part1(parse_input(input_data))
+
+
+def part2(input_data: str) -> int:
+    """Sum all numbers that are a pattern repeated two or more times."""
+    return solve_part2(parse_input(input_data))
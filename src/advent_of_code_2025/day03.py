@@ -3,12 +3,19 @@
 https://adventofcode.com/2025/day/3
 """
 
+from collections.abc import Iterable, Iterator
+
+
+def parse_lines(lines: Iterable[str]) -> Iterator[list[int]]:
+    """Lazily parse the battery banks of day 3, one line at a time."""
+    for line in lines:
+        if line := line.strip():
+            yield [int(char) for char in line]
+
 
 def parse_input(input_data: str) -> list[list[int]]:
     """Parse the input data for day 3."""
-    lines = input_data.strip().splitlines()
-    data = [[int(char) for char in line] for line in lines]
-    return data
+    return list(parse_lines(input_data.strip().splitlines()))
 
 
 def n_largest_in_sequence(numbers: list[int], n: int) -> list[int]:
@@ -33,13 +40,21 @@ def list_to_int(digits: list[int]) -> int:
     return int("".join(str(digit) for digit in digits))
 
 
+def solve_part1(data: Iterable[list[int]]) -> int:
+    """Solve part 1 of day 3 from the parsed battery banks."""
+    return sum(list_to_int(n_largest_in_sequence(row, n=2)) for row in data)
+
+
+def solve_part2(data: Iterable[list[int]]) -> int:
+    """Solve part 2 of day 3 from the parsed battery banks."""
+    return sum(list_to_int(n_largest_in_sequence(row, n=12)) for row in data)
+
+
 def part1(input_data: str) -> int:
     """Solve part 1 of day 3."""
-    data = parse_input(input_data)
-    return sum(list_to_int(n_largest_in_sequence(row, n=2)) for row in data)
+    return solve_part1(parse_input(input_data))
 
 
 def part2(input_data: str) -> int:
     """Solve part 2 of day 3."""
-    data = parse_input(input_data)
-    return sum(list_to_int(n_largest_in_sequence(row, n=12)) for row in data)
+    return solve_part2(parse_input(input_data))
@@ -3,90 +3,183 @@
 https://adventofcode.com/2025/day/4
 """
 
+import os
 from collections import deque
-from collections.abc import Generator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
-from pydantic.dataclasses import dataclass
+from advent_of_code_2025.parallel import read_shared_bytes, shared_bytes, write_shared_bytes
+from advent_of_code_2025.structures.grid import ByteGrid
 
+ROLL = ord("@")
+EMPTY = ord(".")
 
-@dataclass
-class Grid:
-    data: list[list[str]]
-    n_rows: int
-    n_cols: int
+# Translation tables between cells, hex digits and their values
+ROLL_DIGITS = bytes(ord("1") if byte == ROLL else ord("0") for byte in range(256))
+HEX_DIGIT_VALUES = bytes.maketrans(b"0123456789abcdef", bytes(range(16)))
 
-    def get(self, pos: tuple[int, int]) -> str:
-        """Get cell value at position (col, row)."""
-        col, row = pos
-        return self.data[row][col]
 
-    def set(self, pos: tuple[int, int], value: str) -> None:
-        """Set cell value at position (col, row)."""
-        col, row = pos
-        self.data[row][col] = value
+def parse_input(input_data: str) -> ByteGrid:
+    """Parse the input data for day 4."""
+    return ByteGrid.from_text(input_data.strip(), border=".")
 
-    def is_roll(self, pos: tuple[int, int]) -> bool:
-        """Check if position contains a roll."""
-        return self.get(pos) == "@"
 
-    def __iter__(self) -> Generator[tuple[int, int], None, None]:
-        """Iterate over all positions in the grid."""
-        for row in range(self.n_rows):
-            for col in range(self.n_cols):
-                yield (col, row)
+def count_nibbles(cells: bytes | bytearray, offsets: tuple[int, ...]) -> tuple[int, int]:
+    """Get the rolls and their adjacent roll counts as big integers with one hex digit per cell.
 
+    Cell `i` is the i-th hex digit from the top. Adding the roll digits shifted by every neighbour
+    offset counts all neighbours at once (a 3x3 box sum), and as a cell has at most 8 neighbours the
+    digits never carry. An empty border keeps rows from leaking into each other.
+    """
+    rolls = int(cells.translate(ROLL_DIGITS) or b"0", 16)
+    counts = 0
+    for offset in offsets:
+        counts += rolls << 4 * offset if offset > 0 else rolls >> -4 * offset
+    return rolls, counts & ((1 << 4 * len(cells)) - 1)
 
-def parse_input(input_data: str) -> Grid:
-    """Parse the input data for day 4."""
-    data = [list(line) for line in input_data.strip().splitlines()]
-    n_rows = len(data)
-    n_cols = len(data[0]) if n_rows > 0 else 0
-    return Grid(data=data, n_rows=n_rows, n_cols=n_cols)
 
+def neighbour_counts(grid: ByteGrid) -> bytearray:
+    """Count the adjacent rolls of every cell, indexed like the grid's cells."""
+    return cell_counts(grid.cells, grid.neighbour_offsets())
 
-def neighbours(position: tuple[int, int], max_x: int, max_y: int) -> Generator[tuple[int, int], None, None]:
-    x, y = position
-    directions = {(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)}
-    for dx, dy in directions:
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < max_x and 0 <= ny < max_y:
-            yield (nx, ny)
 
+def cell_counts(cells: bytes | bytearray, offsets: tuple[int, ...]) -> bytearray:
+    """Count the adjacent rolls of every cell of a bordered grid's cells."""
+    _, counts = count_nibbles(cells, offsets)
+    return bytearray(f"{counts:0{len(cells)}x}".encode().translate(HEX_DIGIT_VALUES))
 
-def count_adjacent_rolls(grid: Grid, position: tuple[int, int]) -> int:
-    return sum(
-        1 for neighbour_position in neighbours(position, grid.n_cols, grid.n_rows) if grid.is_roll(neighbour_position)
-    )
 
+def count_accessible(
+    cells: bytes | bytearray, offsets: tuple[int, ...], start: int = 0, stop: int | None = None
+) -> int:
+    """Count the accessible rolls among `cells[start:stop]`, the other cells only being neighbours."""
+    stop = len(cells) if stop is None else stop
+    rolls, counts = count_nibbles(cells, offsets)
+    # A count of 4 or more has one of the two high bits of its hex digit set
+    ones = int("0" * start + "1" * (stop - start) + "0" * (len(cells) - stop) or "0", 16)
+    crowded = (counts >> 2 | counts >> 3) & ones
+    return (rolls & ones & ~crowded).bit_count()
 
-def is_accessible(grid: Grid, pos: tuple[int, int]) -> bool:
-    """Check if a roll at position is accessible (< 4 adjacent rolls)."""
-    return grid.is_roll(pos) and count_adjacent_rolls(grid, pos) < 4
 
+def solve_part1(grid: ByteGrid, workers: int | None = None) -> int:
+    """Solve part 1 of day 4 from the parsed grid.
 
-def part1(input_data: str) -> int:
-    """Solve part 1 of day 4."""
-    grid = parse_input(input_data)
-    return sum(1 for position in grid if is_accessible(grid, position))
+    With `workers`, the grid is split in bands of rows counted by that many worker processes.
+    """
+    if workers is not None:
+        return count_accessible_bands(grid, workers)
+    return count_accessible(grid.cells, grid.neighbour_offsets())
 
 
-def part2(input_data: str) -> int:
-    """Solve part 2 of day 4."""
-    grid = parse_input(input_data)
-    queue = deque(position for position in grid if is_accessible(grid, position))
+def peel_rolls(cells: bytearray, offsets: tuple[int, ...], start: int = 0, stop: int | None = None) -> int:
+    """Remove accessible rolls among `cells[start:stop]` until none is left, and return how many were.
+
+    Rolls are peeled like a k-core: every roll's adjacent rolls are counted once, and removing a roll
+    decrements its neighbours' counts, queueing the ones that drop below 4. Cells outside `start:stop`
+    are only neighbours, they are never removed.
+    """
+    stop = len(cells) if stop is None else stop
+    counts = cell_counts(cells, offsets)
+    queue = deque(index for index in range(start, stop) if cells[index] == ROLL and counts[index] < 4)
     removed = 0
 
     while queue:
-        position = queue.popleft()
+        index = queue.popleft()
+        cells[index] = EMPTY
+        removed += 1
 
-        if not is_accessible(grid, position):
-            continue
+        # The border is empty, so neighbours never need a bounds check
+        for offset in offsets:
+            neighbour = index + offset
+            if cells[neighbour] == ROLL:
+                counts[neighbour] -= 1
+                if counts[neighbour] == 3 and start <= neighbour < stop:
+                    queue.append(neighbour)
 
-        grid.set(position, ".")
-        removed += 1
+    return removed
+
+
+def solve_part2(grid: ByteGrid, workers: int | None = None) -> int:
+    """Solve part 2 of day 4 from the parsed grid, which is left untouched.
+
+    With `workers`, the grid is split in bands of rows peeled by that many worker processes.
+    """
+    if workers is not None:
+        return peel_bands(grid, workers)
+    grid = grid.copy()
+    return peel_rolls(grid.cells, grid.neighbour_offsets())
+
+
+def _band_grid(shm_name: str, n_cols: int, row_start: int, row_stop: int) -> ByteGrid:
+    """Read rows `row_start:row_stop` of a shared bordered grid, with the rows around them as border."""
+    stride = n_cols + 2
+    cells = bytearray(read_shared_bytes(shm_name, row_start * stride, (row_stop + 2) * stride))
+    return ByteGrid(cells, row_stop - row_start, n_cols, EMPTY)
+
+
+def _band_bounds(band: ByteGrid) -> tuple[int, int]:
+    return band.index(0, 0), band.index(band.n_rows, 0)
+
+
+def count_accessible_band(shm_name: str, n_cols: int, row_start: int, row_stop: int) -> int:
+    """Count the accessible rolls in a band of rows of a grid in shared memory."""
+    band = _band_grid(shm_name, n_cols, row_start, row_stop)
+    return count_accessible(band.cells, band.neighbour_offsets(), *_band_bounds(band))
 
-        for neighbour_position in neighbours(position, grid.n_cols, grid.n_rows):
-            if is_accessible(grid, neighbour_position):
-                queue.append(neighbour_position)
 
+def peel_band(shm_name: str, n_cols: int, row_start: int, row_stop: int) -> int:
+    """Peel the rolls of a band of rows of a grid in shared memory, and write the band back."""
+    band = _band_grid(shm_name, n_cols, row_start, row_stop)
+    start, stop = _band_bounds(band)
+    removed = peel_rolls(band.cells, band.neighbour_offsets(), start, stop)
+    if removed:
+        write_shared_bytes(shm_name, (row_start + 1) * band.stride, band.cells[start - 1 : stop - 1])
     return removed
+
+
+def _bands(grid: ByteGrid, workers: int | None) -> list[tuple[int, int]]:
+    n_bands = min(workers or os.cpu_count() or 1, max(grid.n_rows, 1))
+    band_rows = -(-grid.n_rows // n_bands)
+    return [(start, min(start + band_rows, grid.n_rows)) for start in range(0, grid.n_rows, band_rows)]
+
+
+def count_accessible_bands(grid: ByteGrid, workers: int | None = None) -> int:
+    """Count the accessible rolls of a grid split in bands of rows counted by worker processes."""
+    bands = _bands(grid, workers)
+    if not bands:
+        return 0
+    with shared_bytes(grid.cells) as shm_name, ProcessPoolExecutor(workers) as executor:
+        starts, stops = zip(*bands, strict=True)
+        return sum(executor.map(count_accessible_band, repeat(shm_name), repeat(grid.n_cols), starts, stops))
+
+
+def peel_bands(grid: ByteGrid, workers: int | None = None) -> int:
+    """Count the rolls removed from a grid split in bands of rows peeled by worker processes.
+
+    The grid is left untouched, the bands are peeled in a shared copy of it.
+
+    In every round each band is peeled on its own until a round removes nothing. The rows next to a band
+    are read while other bands may be writing theirs back, so they can be any mix of the rows' states
+    during the round. Rolls are only ever removed, so such a mix holds at least the rolls that are left:
+    it can only delay a removal to a later round, never cause a wrong one. A round that removes nothing
+    writes nothing, so every band then saw the final grid and no roll is accessible anymore.
+    """
+    bands = _bands(grid, workers)
+    if not bands:
+        return 0
+    removed = 0
+    with shared_bytes(grid.cells) as shm_name, ProcessPoolExecutor(workers) as executor:
+        starts, stops = zip(*bands, strict=True)
+        while round_removed := sum(executor.map(peel_band, repeat(shm_name), repeat(grid.n_cols), starts, stops)):
+            removed += round_removed
+    return removed
+
+
+def part1(input_data: str, workers: int | None = None) -> int:
+    """Solve part 1 of day 4."""
+    return solve_part1(parse_input(input_data), workers)
+
+
+def part2(input_data: str, workers: int | None = None) -> int:
+    """Solve part 2 of day 4."""
+    return solve_part2(parse_input(input_data), workers)
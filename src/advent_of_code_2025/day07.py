@@ -3,10 +3,11 @@
 https://adventofcode.com/2025/day/7
 """
 
-from collections import deque
 from typing import NamedTuple
 
-from pydantic.dataclasses import dataclass
+from advent_of_code_2025.structures.grid import ByteGrid
+
+SPLITTER = ord("^")
 
 
 class Point(NamedTuple):
@@ -14,88 +15,70 @@ class Point(NamedTuple):
     col: int
 
 
-@dataclass
-class Grid:
-    n_rows: int
-    n_cols: int
-    _cells: list[list[str]]
-
-    def get_cell(self, point: Point) -> str | None:
-        """Get the cell value at the given point."""
-        if 0 <= point.row < self.n_rows and 0 <= point.col < self.n_cols:
-            return self._cells[point.row][point.col]
-        return None
-
-
-def parse_input(input_data: str) -> tuple[Grid, Point]:
+def parse_input(input_data: str) -> tuple[ByteGrid, Point]:
     """Parse the input data for day 7."""
-    cells = []
-    start_pos: Point = Point(-1, -1)
-    for row_idx, line in enumerate(input_data.splitlines()):
-        cells.append(list(line))
-        if "S" in line:
-            start_pos = Point(row=row_idx, col=line.index("S"))
-    cells = [list(line) for line in input_data.splitlines()]
-    n_rows = len(cells)
-    n_cols = len(cells[0]) if n_rows > 0 else 0
-    return Grid(n_rows=n_rows, n_cols=n_cols, _cells=cells), start_pos
-
-
-def part1(input_data: str) -> int:
-    """Solve part 1 of day 7."""
-    grid, start = parse_input(input_data)
+    grid = ByteGrid.from_text(input_data.rstrip("\n"))
+    start_pos = grid.find("S")
+    return grid, Point(-1, -1) if start_pos is None else Point(*start_pos)
 
-    queue: deque[Point] = deque([start])
-    visited: set[Point] = set()
-    splits = 0
 
-    while queue:
-        current = queue.popleft()
+def row_masks(grid: ByteGrid, value: str) -> list[int]:
+    """Get a bitmask per row of the columns holding `value`, column 0 being the lowest bit."""
+    table = bytearray(b"0" * 256)
+    table[ord(value)] = ord("1")
+    return [int(row.translate(table)[::-1] or b"0", 2) for row in grid.rows()]
 
-        while (current_value := grid.get_cell(current)) and current not in visited:
-            visited.add(current)
-            if current_value == "^":
-                splits += 1
 
-                left_point = Point(row=current.row, col=current.col - 1)
-                right_point = Point(row=current.row, col=current.col + 1)
-                queue.appendleft(left_point)
-                queue.appendleft(right_point)
-                break
+def solve_part1(data: tuple[ByteGrid, Point]) -> int:
+    """Solve part 1 of day 7 from the parsed manifold and start position.
 
-            current = Point(row=current.row + 1, col=current.col)
+    The beams of a row are the set bits of one integer: the ones on a splitter are counted and moved
+    one column left and right, and the rest carry on down. Splitters are never next to each other.
+    """
+    grid, start = data
+    in_grid = (1 << grid.n_cols) - 1
+    beams = 1 << start.col
+    splits = 0
+    for splitters in row_masks(grid, "^")[start.row :]:
+        hits = beams & splitters
+        splits += hits.bit_count()
+        beams = (beams & ~splitters | hits << 1 | hits >> 1) & in_grid
     return splits
 
 
-def count_timelines(grid: Grid, pos: Point, memo: dict[Point, int]) -> int:
-    """Count the number of timelines from the given position."""
+def count_timelines(grid: ByteGrid, pos: Point) -> int:
+    """Count the number of timelines from the given position.
 
-    if grid.get_cell(pos) is None:
+    Rows are swept top to bottom carrying the number of timelines in each column, a splitter sending
+    its count to the columns on both sides. Splitters are never next to each other.
+    """
+    if grid.get(*pos) is None:
         return 0
 
-    if pos.row == grid.n_rows - 1:
-        return 1
+    counts = [0] * grid.n_cols
+    counts[pos.col] = 1
+    for row in range(pos.row, grid.n_rows - 1):
+        for col, cell in enumerate(grid.row(row)):
+            if cell == SPLITTER and counts[col]:
+                if col > 0:
+                    counts[col - 1] += counts[col]
+                if col < grid.n_cols - 1:
+                    counts[col + 1] += counts[col]
+                counts[col] = 0
+    return sum(counts)
 
-    if pos in memo:
-        return memo[pos]
 
-    total_timelines = 0
+def solve_part2(data: tuple[ByteGrid, Point]) -> int:
+    """Solve part 2 of day 7 from the parsed manifold and start position."""
+    grid, start = data
+    return count_timelines(grid, start)
 
-    if grid.get_cell(pos) == "^":
-        left_point = Point(row=pos.row, col=pos.col - 1)
-        right_point = Point(row=pos.row, col=pos.col + 1)
-        total_timelines += count_timelines(grid, left_point, memo)
-        total_timelines += count_timelines(grid, right_point, memo)
-    else:
-        down_point = Point(row=pos.row + 1, col=pos.col)
-        total_timelines += count_timelines(grid, down_point, memo)
 
-    memo[pos] = total_timelines
-    return total_timelines
+def part1(input_data: str) -> int:
+    """Solve part 1 of day 7."""
+    return solve_part1(parse_input(input_data))
 
 
 def part2(input_data: str) -> int:
     """Solve part 2 of day 7."""
-    grid, start = parse_input(input_data)
-    memo: dict[Point, int] = {}
-    return count_timelines(grid, start, memo)
+    return solve_part2(parse_input(input_data))
@@ -3,106 +3,355 @@
 https://adventofcode.com/2025/day/8
 """
 
+import heapq
+import random
 from collections import defaultdict
-from collections.abc import Hashable
-from math import prod
-from typing import Generic, TypeVar
-
-Coord3d = tuple[int, int, int]
-T = TypeVar("T", bound=Hashable)
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import islice, product, repeat
+from math import inf, isqrt, prod
 
+from advent_of_code_2025.parallel import read_shared_ints, shared_ints
+from advent_of_code_2025.structures.union_find import UnionFind
 
-class UnionFind(Generic[T]):
-    def __init__(self, items: list[T]) -> None:
-        """Initialize the Union-Find data structure."""
-        self.parent: dict[T, T] = {item: item for item in items}
-        self.rank: dict[T, int] = dict.fromkeys(items, 0)
+Coord3d = tuple[int, int, int]
 
-    def find(self, item: T) -> T:
-        """Find the root of the set containing the item."""
-        if self.parent[item] != item:
-            self.parent[item] = self.find(self.parent[item])
-        return self.parent[item]
+# Number of shortest connections made in part 1 of the puzzle input
+NUM_CONNECTIONS = 1000
 
-    def union(self, item_1: T, item_2: T) -> bool:
-        """Union the sets containing item_1 and item_2."""
-        root_1 = self.find(item_1)
-        root_2 = self.find(item_2)
+# Points per side of the tiles of the pair matrix computed by each worker
+TILE_SIZE = 1024
 
-        if root_1 == root_2:
-            return False
+# Neighbouring grid cells that come after a cell, so every pair of cells is visited once
+FORWARD_CELLS = [offset for offset in product((-1, 0, 1), repeat=3) if offset > (0, 0, 0)]
 
-        if self.rank[root_1] < self.rank[root_2]:
-            self.parent[root_1] = root_2
-        elif self.rank[root_1] > self.rank[root_2]:
-            self.parent[root_2] = root_1
-        else:
-            self.parent[root_2] = root_1
-            self.rank[root_1] += 1
+# Most points whose edges are all built and sorted at once, about 8 million edges
+MAX_SORTED_POINTS = 4096
 
-        return True
+# Pairs of points the closest pairs search may compare per point and per pair it looks for
+CANDIDATES_PER_PAIR = 16
 
-    def get_component_sizes(self) -> list[int]:
-        """Get the sizes of all connected components."""
-        component_sizes: dict[T, int] = defaultdict(int)
-        for item in self.parent:
-            root = self.find(item)
-            component_sizes[root] += 1
-        return list(component_sizes.values())
+# Smallest rank of a sampled pair distance trusted to estimate the search radius
+MIN_SAMPLE_RANK = 32
 
 
-def parse_input(input_data: str) -> list[Coord3d]:
-    """Parse the input data for day 8."""
+def parse_lines(lines: Iterable[str]) -> list[Coord3d]:
+    """Parse the junction boxes of day 8 one line at a time."""
     data = []
-    for line in input_data.strip().splitlines():
+    for line in lines:
+        if not line.strip():
+            continue
         x, y, z = map(int, line.split(","))
         data.append((x, y, z))
     return data
 
 
-def euclidean_distance(a: tuple[int, ...], b: tuple[int, ...]) -> float:
-    """Calculate the Euclidean distance between two points."""
-    if len(a) != len(b):
-        raise ValueError()
-    return sum((x - y) ** 2 for x, y in zip(a, b, strict=True)) ** 0.5
+def parse_input(input_data: str) -> list[Coord3d]:
+    """Parse the input data for day 8."""
+    return parse_lines(input_data.strip().splitlines())
 
 
-def get_distances_sorted(points: list[Coord3d]) -> list[tuple[float, Coord3d, Coord3d]]:
-    """Get all pairwise distances between points, sorted in ascending order."""
-    edges: list[tuple[float, Coord3d, Coord3d]] = [
-        (euclidean_distance(points[i], points[j]), points[i], points[j])
-        for i in range(len(points))
-        for j in range(i + 1, len(points))
-    ]
+def squared_distance(a: Coord3d, b: Coord3d) -> int:
+    """Calculate the squared Euclidean distance between two points, exactly."""
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+def get_distances_sorted(points: list[Coord3d]) -> list[tuple[int, Coord3d, Coord3d]]:
+    """Get all pairwise squared distances between points, sorted in ascending order.
+
+    Squared distances are exact integers, so equal distances tie exactly and sort by their points.
+    """
+    edges: list[tuple[int, Coord3d, Coord3d]] = []
+    for i, point_a in enumerate(points):
+        x, y, z = point_a
+        edges.extend(
+            ((x - bx) ** 2 + (y - by) ** 2 + (z - bz) ** 2, point_a, point_b)
+            for point_b in points[i + 1 :]
+            for bx, by, bz in (point_b,)
+        )
     edges.sort()
     return edges
 
 
-def part1(input_data: str, num_connections: int) -> int:
-    """Solve part 1 of day 8."""
-    points = parse_input(input_data)
-    uf = UnionFind(points)
-    edges = get_distances_sorted(points)
+def tile_edges(
+    shm_name: str, rows: tuple[int, int], cols: tuple[int, int], k: int | None = None
+) -> list[tuple[int, Coord3d, Coord3d]]:
+    """Get the sorted squared distances of the pairs (i, j), i < j, in one tile of the pair matrix.
+
+    Coordinates are read from the shared memory block `shm_name`. With `k`, only the k closest are kept.
+    """
+    (row_start, row_stop), (col_start, col_stop) = rows, cols
+    row_coords = read_shared_ints(shm_name, 3 * row_start, 3 * row_stop)
+    col_coords = read_shared_ints(shm_name, 3 * col_start, 3 * col_stop)
+    row_points = list(zip(row_coords[::3], row_coords[1::3], row_coords[2::3], strict=True))
+    col_points = list(zip(col_coords[::3], col_coords[1::3], col_coords[2::3], strict=True))
+
+    edges: list[tuple[int, Coord3d, Coord3d]] = []
+    for i, point_a in enumerate(row_points, row_start):
+        x, y, z = point_a
+        edges.extend(
+            ((x - bx) ** 2 + (y - by) ** 2 + (z - bz) ** 2, point_a, point_b)
+            for point_b in col_points[max(i + 1 - col_start, 0) :]
+            for bx, by, bz in (point_b,)
+        )
+    if k is not None:
+        return heapq.nsmallest(k, edges)
+    edges.sort()
+    return edges
+
+
+def get_distances_sorted_parallel(
+    points: list[Coord3d], k: int | None = None, workers: int | None = None, tile_size: int = TILE_SIZE
+) -> list[tuple[int, Coord3d, Coord3d]]:
+    """Get the same edges as `get_distances_sorted` (only the first `k` if given) using worker processes.
+
+    The pair matrix is split into square tiles that workers compute from coordinates in shared memory,
+    and the sorted tiles are merged with a heap. All n(n-1)/2 edges are only built for up to
+    `MAX_SORTED_POINTS` points, larger inputs must ask for the first `k`.
+    """
+    if k is None and len(points) > MAX_SORTED_POINTS:
+        raise ValueError(len(points))
+    bounds = [(start, min(start + tile_size, len(points))) for start in range(0, len(points), tile_size)]
+    tiles = [(rows, cols) for n, rows in enumerate(bounds) for cols in bounds[n:]]
+    if not tiles:
+        return []
+
+    with (
+        shared_ints([coord for point in points for coord in point]) as shm_name,
+        ProcessPoolExecutor(workers) as executor,
+    ):
+        row_tiles, col_tiles = zip(*tiles, strict=True)
+        tile_results = list(executor.map(tile_edges, repeat(shm_name), row_tiles, col_tiles, repeat(k)))
+    return list(islice(heapq.merge(*tile_results), k))
+
+
+def grid_cells(points: list[Coord3d], radius: int) -> dict[Coord3d, list[int]]:
+    """Hash the indices of the points into cubes of side `radius`."""
+    cells: dict[Coord3d, list[int]] = defaultdict(list)
+    for idx, (x, y, z) in enumerate(points):
+        cells[x // radius, y // radius, z // radius].append(idx)
+    return cells
+
+
+def count_candidates(cells: dict[Coord3d, list[int]]) -> int:
+    """Count the pairs of points in the same or neighbouring cells, without building them."""
+    total = 0
+    for (cx, cy, cz), indices in cells.items():
+        total += len(indices) * (len(indices) - 1) // 2
+        for dx, dy, dz in FORWARD_CELLS:
+            neighbour = cells.get((cx + dx, cy + dy, cz + dz))
+            if neighbour is not None:
+                total += len(indices) * len(neighbour)
+    return total
+
+
+def iter_candidates(cells: dict[Coord3d, list[int]], part: int = 0, n_parts: int = 1) -> Iterator[tuple[int, int]]:
+    """Yield the index pairs (i, j), i < j, of the points in the same or neighbouring cells.
+
+    With `n_parts`, only the pairs found from every `n_parts`-th cell starting at cell `part` are
+    yielded, so the parts together yield every pair once.
+    """
+    for (cx, cy, cz), indices in islice(cells.items(), part, None, n_parts):
+        for n, i in enumerate(indices):
+            for j in indices[n + 1 :]:
+                yield i, j
+        for dx, dy, dz in FORWARD_CELLS:
+            neighbour = cells.get((cx + dx, cy + dy, cz + dz))
+            if neighbour is not None:
+                for i in indices:
+                    for j in neighbour:
+                        yield (i, j) if i < j else (j, i)
+
+
+def pairs_within(
+    points: list[Coord3d],
+    radius: int,
+    cells: dict[Coord3d, list[int]] | None = None,
+    part: int = 0,
+    n_parts: int = 1,
+) -> list[tuple[int, Coord3d, Coord3d]]:
+    """Get every pair of points at most `radius` apart, keyed by their squared distance.
+
+    Points are hashed into cubes of side `radius` (unless their `cells` are given), so only points in
+    neighbouring cubes are compared. Pairs keep the order of the points in the input. With `n_parts`,
+    only one part of the cells is searched, see `iter_candidates`.
+    """
+    if cells is None:
+        cells = grid_cells(points, radius)
+    max_distance = radius * radius
+    pairs: list[tuple[int, Coord3d, Coord3d]] = []
+    for i, j in iter_candidates(cells, part, n_parts):
+        distance = squared_distance(points[i], points[j])
+        if distance <= max_distance:
+            pairs.append((distance, points[i], points[j]))
+    return pairs
+
 
-    for _, point_a, point_b in edges[:num_connections]:
-        uf.union(point_a, point_b)
+def closest_pairs_within(
+    shm_name: str, n_points: int, radius: int, part: int, n_parts: int, k: int
+) -> tuple[int, list[tuple[int, Coord3d, Coord3d]]]:
+    """Search one part of the cells for the pairs at most `radius` apart, from points in shared memory.
 
-    component_sizes = sorted(uf.get_component_sizes(), reverse=True)
+    Return how many pairs were found and the `k` closest of them, sorted.
+    """
+    coords = read_shared_ints(shm_name, 0, 3 * n_points)
+    points = list(zip(coords[::3], coords[1::3], coords[2::3], strict=True))
+    pairs = pairs_within(points, radius, part=part, n_parts=n_parts)
+    return len(pairs), heapq.nsmallest(k, pairs)
+
+
+def estimate_radius(points: list[Coord3d], k: int, n_samples: int) -> int:
+    """Estimate the distance of the k-th closest pair from the distances of `n_samples` random pairs.
+
+    The k-th closest pair is at the k/(n(n-1)/2) quantile of all pair distances, whatever the points'
+    spread, so the same quantile of a sample is a good start even when a few outliers stretch the space.
+    Quantiles too small to be sampled are extrapolated from a larger one, as the number of pairs within a
+    short distance grows with its cube.
+    """
+    n_points = len(points)
+    rng = random.Random(0)  # noqa: S311
+    distances = []
+    for _ in range(n_samples):
+        i = rng.randrange(n_points)
+        j = rng.randrange(n_points - 1)
+        distances.append(squared_distance(points[i], points[j + (j >= i)]))
+    quantile = k / (n_points * (n_points - 1) // 2)
+    rank = min(max(int(quantile * n_samples), MIN_SAMPLE_RANK), n_samples - 1)
+    distance = isqrt(heapq.nsmallest(rank + 1, distances)[-1])
+    return max(1, int(distance * min(1.0, quantile * n_samples / (rank + 1)) ** (1 / 3)))
+
+
+def k_closest_pairs(points: list[Coord3d], k: int, workers: int | None = None) -> list[tuple[int, Coord3d, Coord3d]]:
+    """Get the `k` closest pairs of points, in the same order as `get_distances_sorted`.
+
+    The search radius starts at a sampled estimate of the k-th closest distance. It is bisected between
+    radii holding fewer than `k` pairs and radii whose cells would compare more than
+    `CANDIDATES_PER_PAIR * (n + k)` pairs, so O(n + k) pairs are built instead of all n(n-1)/2.
+
+    With `workers`, the cells are searched by that many worker processes reading the points from shared
+    memory, each keeping only its `k` closest pairs.
+    """
+    n_points = len(points)
+    if k <= 0 or n_points < 2:
+        return []
+    if k >= n_points * (n_points - 1) // 2:
+        return get_distances_sorted(points)[:k]
+
+    max_candidates = CANDIDATES_PER_PAIR * (n_points + k)
+    radius = estimate_radius(points, k, min(2 * (n_points + k), n_points * (n_points - 1) // 2))
+    with ExitStack() as stack:
+        if workers is not None:
+            shm_name = stack.enter_context(shared_ints([coord for point in points for coord in point]))
+            executor = stack.enter_context(ProcessPoolExecutor(workers))
+
+        # Radii known to hold fewer than k pairs, and to compare too many candidates
+        low, high = 0, None
+        while True:
+            cells = grid_cells(points, radius)
+            if radius > low + 1 and count_candidates(cells) > max_candidates:
+                high = radius
+                radius = (low + radius) // 2
+                continue
+            # Past this point the radius is either cheap enough or the smallest one left that may hold k pairs
+            if workers is None:
+                pairs = pairs_within(points, radius, cells)
+                n_pairs = len(pairs)
+            else:
+                part_results = list(
+                    executor.map(
+                        closest_pairs_within,
+                        repeat(shm_name),
+                        repeat(n_points),
+                        repeat(radius),
+                        range(workers),
+                        repeat(workers),
+                        repeat(k),
+                    )
+                )
+                n_pairs = sum(n_part_pairs for n_part_pairs, _ in part_results)
+                pairs = list(islice(heapq.merge(*(part_pairs for _, part_pairs in part_results)), k))
+            if n_pairs >= k:
+                break
+            low = radius
+            if high is not None and high <= low:
+                high = None
+            radius = radius * 2 if high is None else max((low + high) // 2, low + 1)
+    pairs.sort()
+    return pairs[:k]
+
+
+def solve_part1(points: list[Coord3d], num_connections: int = NUM_CONNECTIONS, workers: int | None = None) -> int:
+    """Solve part 1 of day 8 from the parsed junction boxes.
+
+    With `workers`, the closest pairs are searched by that many worker processes.
+    """
+    closest = k_closest_pairs(points, num_connections, workers)
+    index = {point: idx for idx, point in enumerate(points)}
+    uf = UnionFind(len(points))
+    uf.union_many((index[point_a], index[point_b]) for _, point_a, point_b in closest)
+
+    component_sizes = sorted(uf.component_sizes(), reverse=True)
     return prod(component_sizes[:3])
 
 
-def part2(input_data: str) -> int:
-    """Solve part 2 of day 8."""
-    points = parse_input(input_data)
-    uf = UnionFind(points)
-    edges = get_distances_sorted(points)
+def last_mst_edge(points: list[Coord3d]) -> tuple[Coord3d, Coord3d]:
+    """Get the connection that joins all points into one circuit when connecting the closest pairs first.
 
+    That is the longest edge of the minimum spanning tree, found with dense Prim's algorithm in O(n^2)
+    time and O(n) memory. Ties are broken like `get_distances_sorted`, by the points of each pair.
+    """
     n_points = len(points)
-    for _, point_a, point_b in edges:
-        if uf.union(point_a, point_b):
-            n_points -= 1
+    if n_points < 2:
+        raise ValueError()
+
+    def pair(i: int, j: int) -> tuple[Coord3d, Coord3d]:
+        return (points[i], points[j]) if i < j else (points[j], points[i])
+
+    xs, ys, zs = (list(coords) for coords in zip(*points, strict=True))
+    best_distance: list[float] = [inf] * n_points
+    best_from = [0] * n_points
+    remaining = list(range(1, n_points))
+    current = 0
+    longest: tuple[float, Coord3d, Coord3d] = (-1, points[0], points[0])
+
+    while remaining:
+        cx, cy, cz = xs[current], ys[current], zs[current]
+        closest_pos = 0
+        closest_distance = inf
+        for pos, idx in enumerate(remaining):
+            distance = (xs[idx] - cx) ** 2 + (ys[idx] - cy) ** 2 + (zs[idx] - cz) ** 2
+            if distance < best_distance[idx] or (
+                distance == best_distance[idx] and pair(current, idx) < pair(best_from[idx], idx)
+            ):
+                best_distance[idx] = distance
+                best_from[idx] = current
+            if best_distance[idx] < closest_distance or (
+                best_distance[idx] == closest_distance
+                and pair(best_from[idx], idx) < pair(best_from[remaining[closest_pos]], remaining[closest_pos])
+            ):
+                closest_pos = pos
+                closest_distance = best_distance[idx]
+
+        current = remaining[closest_pos]
+        remaining[closest_pos] = remaining[-1]
+        remaining.pop()
+        longest = max(longest, (closest_distance, *pair(best_from[current], current)))
+
+    return longest[1], longest[2]
 
-        if n_points == 1:
-            return point_a[0] * point_b[0]
 
-    raise ValueError()
+def solve_part2(points: list[Coord3d]) -> int:
+    """Solve part 2 of day 8 from the parsed junction boxes."""
+    point_a, point_b = last_mst_edge(points)
+    return point_a[0] * point_b[0]
+
+
+def part1(input_data: str, num_connections: int = NUM_CONNECTIONS, workers: int | None = None) -> int:
+    """Solve part 1 of day 8."""
+    return solve_part1(parse_input(input_data), num_connections, workers)
+
+
+def part2(input_data: str) -> int:
+    """Solve part 2 of day 8."""
+    return solve_part2(parse_input(input_data))
@@ -3,11 +3,20 @@
 https://adventofcode.com/2025/day/9
 """
 
-from collections import defaultdict
-from collections.abc import Iterator
-from itertools import combinations_with_replacement
+import heapq
+from bisect import bisect_left
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from itertools import accumulate, combinations_with_replacement
+from operator import add
 from typing import NamedTuple
 
+from advent_of_code_2025.structures.rectilinear import PointLocator
+
+# Partners of a red tile picked at once when searching rectangles by area
+PARTNER_CHUNK_SIZE = 64
+
 
 class Point(NamedTuple):
     x: int
@@ -35,29 +44,15 @@ def get_area(p1: Point, p2: Point) -> int:
     return (abs(p1.x - p2.x) + 1) * (abs(p1.y - p2.y) + 1)
 
 
-def in_squared_polygon(p: Point, polygon: list[Point]) -> bool:
-    x, y = p.x, p.y
-    crossings = 0
-    edges = zip(polygon, [*polygon[1:], polygon[0]], strict=True)
-
-    for p1, p2 in edges:
-        max_x, min_x = max(p1.x, p2.x), min(p1.x, p2.x)
-        max_y, min_y = max(p1.y, p2.y), min(p1.y, p2.y)
-        if p1.x == p2.x:
-            is_on_edge = (x == p1.x) and (min_y <= y <= max_y)
-            if is_on_edge:
-                return True
-            if min_y < y < max_y and x < max_x:
-                crossings += 1
-        elif p1.y == p2.y:
-            is_on_edge = (y == p1.y) and (min_x <= x <= max_x)
-            if is_on_edge:
-                return True
-            continue
-        else:
-            raise ValueError()
+@lru_cache(maxsize=8)
+def point_locator(polygon: tuple[Point, ...]) -> PointLocator:
+    """Get a point locator of a polygon, shared by the queries on the same polygon."""
+    return PointLocator(list(polygon))
+
 
-    return crossings % 2 == 1
+def in_squared_polygon(p: Point, polygon: list[Point]) -> bool:
+    """Check if a tile is inside or on a rectilinear polygon."""
+    return point_locator(tuple(polygon)).contains(p)
 
 
 def get_areas(grouped_points: dict[int, list[int]]) -> Iterator[tuple[Point, Point, int]]:
@@ -86,61 +81,174 @@ def get_all_rectangle_candidates(points: list[Point]) -> Iterator[tuple[Point, P
             yield p1, p2, area
 
 
+def iter_rectangles_by_area(
+    points: list[Point], fits: Callable[[Point, Point], bool] | None = None, chunk_size: int = PARTNER_CHUNK_SIZE
+) -> Iterator[tuple[Point, Point, int]]:
+    """Generate the rectangles of `get_all_rectangle_candidates` lazily, largest area first.
+
+    A heap holds the next best partner of every red tile. Once a tile's best partner has been used,
+    its next `chunk_size` partners are picked in one O(n) pass over its partners, and picked again when
+    they run out. The memory stays in O(n * chunk_size) however far the search goes, and a search that
+    stops early never sorts all pairs. With `fits`, only the rectangles for which `fits(p1, p2)` is true
+    are generated.
+    """
+
+    def partner_areas(i: int) -> Iterator[tuple[int, int]]:
+        p1 = points[i]
+        x, y = p1
+        for j, p2 in enumerate(points[i + 1 :], i + 1):
+            if fits is None or fits(p1, p2):
+                yield -(abs(x - p2.x) + 1) * (abs(y - p2.y) + 1), j
+
+    heap = []
+    for i in range(len(points) - 1):
+        best = min(partner_areas(i), default=None)
+        if best is not None:
+            heap.append((best[0], i, best[1]))
+    heapq.heapify(heap)
+
+    # The next partners of the tiles whose best partner has been used, as (-area, j) in order
+    pending: dict[int, deque[tuple[int, int]]] = {}
+    while heap:
+        neg_area, i, j = heap[0]
+        yield points[i], points[j], -neg_area
+
+        partners = pending.pop(i, None)
+        if partners is None:
+            used = (neg_area, j)
+            partners = deque(heapq.nsmallest(chunk_size, (key for key in partner_areas(i) if key > used)))
+        if partners:
+            neg_area, j = partners.popleft()
+            heapq.heapreplace(heap, (neg_area, i, j))
+            if partners:
+                pending[i] = partners
+        else:
+            heapq.heappop(heap)
+
+
 def find_max_area(grouped_points: dict[int, list[int]]) -> int:
     """Find the maximum area formed by points with the same x-coordinate."""
     return max(get_areas(grouped_points), key=lambda item: item[2])[2]
 
 
-def get_green_lines(polygon: list[Point]) -> list[tuple[Point, Point]]:
-    """Get all green line segments (edges between consecutive red tiles)."""
-    lines = []
-    for i in range(len(polygon)):
-        p1 = polygon[i]
-        p2 = polygon[(i + 1) % len(polygon)]
-        lines.append((p1, p2))
-    return lines
-
-
-def line_intersects_rectangle(line_start: Point, line_end: Point, rect_p1: Point, rect_p2: Point) -> bool:
-    """Check if a line segment intersects the interior of a rectangle."""
-    min_x, max_x = min(rect_p1.x, rect_p2.x), max(rect_p1.x, rect_p2.x)
-    min_y, max_y = min(rect_p1.y, rect_p2.y), max(rect_p1.y, rect_p2.y)
-
-    line_min_x, line_max_x = min(line_start.x, line_end.x), max(line_start.x, line_end.x)
-    line_min_y, line_max_y = min(line_start.y, line_end.y), max(line_start.y, line_end.y)
-
-    return line_min_x < max_x and line_max_x > min_x and line_min_y < max_y and line_max_y > min_y
-
-
-def find_max_area_in_polygon(polygon: list[Point]) -> int:
-    """Find the maximum area using green line intersection check."""
-
-    candidates = sorted(get_all_rectangle_candidates(polygon), key=lambda x: x[2], reverse=True)
+class CompressedPolygon:
+    """Tiles inside or on a rectilinear polygon, on a grid compressed to the polygon's coordinates.
+
+    Compressed columns alternate between the distinct x-coordinates of the vertices and the open gaps
+    between them (same for rows), so every compressed cell is either fully inside or fully outside.
+    A 2D prefix sum of the outside cells answers whether a rectangle is fully inside in O(1).
+    """
+
+    def __init__(self, polygon: list[Point]) -> None:
+        xs = sorted({p.x for p in polygon})
+        ys = sorted({p.y for p in polygon})
+        self.xs, self.ys = xs, ys
+        self.col_of = {x: 2 * i for i, x in enumerate(xs)}
+        self.row_of = {y: 2 * i for i, y in enumerate(ys)}
+        n_cols, n_rows = 2 * len(xs) - 1, 2 * len(ys) - 1
+
+        # Gaps between consecutive coordinates hold no tiles, so they never make a rectangle invalid
+        empty_cols = bytes(c % 2 == 1 and xs[c // 2 + 1] - xs[c // 2] == 1 for c in range(n_cols))
+        empty_rows = bytes(r % 2 == 1 and ys[r // 2 + 1] - ys[r // 2] == 1 for r in range(n_rows))
+
+        # Mark the boundary, and where the inside parity flips (crossing rule: vertical edges include
+        # their lower end and exclude their upper end)
+        inside = [bytearray(n_cols) for _ in range(n_rows)]
+        flips = [bytearray(n_cols + 1) for _ in range(n_rows)]
+        for p1, p2 in zip(polygon, [*polygon[1:], polygon[0]], strict=True):
+            c1, c2 = sorted((self.col_of[p1.x], self.col_of[p2.x]))
+            r1, r2 = sorted((self.row_of[p1.y], self.row_of[p2.y]))
+            if c1 == c2:
+                for r in range(r1, r2 + 1):
+                    inside[r][c1] = 1
+                for r in range(r1, r2):
+                    flips[r][c1 + 1] ^= 1
+            elif r1 == r2:
+                inside[r1][c1 : c2 + 1] = b"\x01" * (c2 - c1 + 1)
+            else:
+                raise ValueError()
+
+        prefix = [[0] * (n_cols + 1)]
+        for r in range(n_rows):
+            row, row_flips = inside[r], flips[r]
+            parity = 0
+            outside = [0] * n_cols
+            for c in range(n_cols):
+                parity ^= row_flips[c]
+                outside[c] = not (parity or row[c] or empty_cols[c] or empty_rows[r])
+            prefix.append(list(map(add, prefix[-1], accumulate(outside, initial=0))))
+        self.prefix = prefix
+
+    def contains_rectangle(self, p1: Point, p2: Point) -> bool:
+        """Check if every tile of the rectangle with corners p1 and p2 is inside or on the polygon."""
+        c1, c2 = self.col_of[p1.x], self.col_of[p2.x]
+        if c1 > c2:
+            c1, c2 = c2, c1
+        r1, r2 = self.row_of[p1.y], self.row_of[p2.y]
+        if r1 > r2:
+            r1, r2 = r2, r1
+        return self._count_outside(c1, r1, c2, r2) == 0
+
+    def _count_outside(self, c1: int, r1: int, c2: int, r2: int) -> int:
+        """Count the outside cells of the compressed rectangle from (c1, r1) to (c2, r2) included."""
+        prefix = self.prefix
+        return prefix[r2 + 1][c2 + 1] - prefix[r1][c2 + 1] - prefix[r2 + 1][c1] + prefix[r1][c1]
+
+    def reach(self, p: Point) -> tuple[int, int, int, int]:
+        """Get the box (min x, max x, min y, max y) of red tiles a contained rectangle with corner `p` may reach.
+
+        Two edges of such a rectangle run along the row and the column of `p`, so its other corners are no
+        further than the tiles inside extend from `p` in both directions.
+        """
+        c, r = self.col_of[p.x], self.row_of[p.y]
+        n_cols, n_rows = 2 * len(self.xs) - 1, 2 * len(self.ys) - 1
+        right = bisect_left(range(c, n_cols, 2), True, key=lambda c2: self._count_outside(c, r, c2, r) > 0)
+        left = bisect_left(range(c, -1, -2), True, key=lambda c1: self._count_outside(c1, r, c, r) > 0)
+        up = bisect_left(range(r, n_rows, 2), True, key=lambda r2: self._count_outside(c, r, c, r2) > 0)
+        down = bisect_left(range(r, -1, -2), True, key=lambda r1: self._count_outside(c, r1, c, r) > 0)
+        col, row = c // 2, r // 2
+        return self.xs[col - left + 1], self.xs[col + right - 1], self.ys[row - down + 1], self.ys[row + up - 1]
+
+
+def find_max_area_in_polygon_compressed(polygon: list[Point]) -> int:
+    """Find the maximum area of a rectangle with red corners that only covers red or green tiles."""
+    compressed = CompressedPolygon(polygon)
+    # Most pairs of red tiles are ruled out by how far the inside extends from each corner, which leaves
+    # few rectangles to check in order of area
+    reach = {p: compressed.reach(p) for p in polygon}
+
+    def fits(p1: Point, p2: Point) -> bool:
+        min_x1, max_x1, min_y1, max_y1 = reach[p1]
+        min_x2, max_x2, min_y2, max_y2 = reach[p2]
+        return (
+            min_x1 <= p2.x <= max_x1
+            and min_y1 <= p2.y <= max_y1
+            and min_x2 <= p1.x <= max_x2
+            and min_y2 <= p1.y <= max_y2
+        )
+
+    for p1, p2, area in iter_rectangles_by_area(polygon, fits):
+        if compressed.contains_rectangle(p1, p2):
+            return area
+    return 0
 
-    green_lines = get_green_lines(polygon)
-    green_lines.sort(key=lambda line: abs(line[1].x - line[0].x) + abs(line[1].y - line[0].y), reverse=True)
 
-    for p1, p2, area in candidates:
-        has_intersection = False
-        for line_start, line_end in green_lines:
-            if line_intersects_rectangle(line_start, line_end, p1, p2):
-                has_intersection = True
-                break
+def solve_part1(points: list[Point]) -> int:
+    """Solve part 1 of day 9 from the parsed red tiles."""
+    grouped_points = group_by_x(points)
+    return find_max_area(grouped_points)
 
-        if not has_intersection:
-            return area
 
-    return 0
+def solve_part2(points: list[Point]) -> int:
+    """Solve part 2 of day 9 from the parsed red tiles."""
+    return find_max_area_in_polygon_compressed(points)
 
 
 def part1(input_data: str) -> int:
     """Solve part 1 of day 9."""
-    points = parse_input(input_data)
-    grouped_points = group_by_x(points)
-    return find_max_area(grouped_points)
+    return solve_part1(parse_input(input_data))
 
 
 def part2(input_data: str) -> int:
     """Solve part 2 of day 9."""
-    points = parse_input(input_data)
-    return find_max_area_in_polygon(points)
+    return solve_part2(parse_input(input_data))
@@ -0,0 +1,147 @@
+"""Deterministic synthetic puzzle inputs, for benchmarking the solutions at scale.
+
+Every generator takes a `size` and a seeded `random.Random` and returns an input in the same format as
+the real puzzle input. What `size` counts depends on the day and is described by each generator.
+"""
+
+import random
+from collections.abc import Callable
+
+Generator = Callable[[int, random.Random], str]
+
+
+def generate_day01(size: int, rng: random.Random) -> str:
+    """Generate `size` dial rotations."""
+    return "\n".join(f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(size))
+
+
+def generate_day02(size: int, rng: random.Random) -> str:
+    """Generate `size` product ID ranges."""
+    ranges = []
+    for _ in range(size):
+        n_digits = rng.randint(2, 10)
+        start = rng.randint(10 ** (n_digits - 1), 10**n_digits - 1)
+        end = min(start + rng.randint(0, 10 ** (n_digits // 2 + 1)), 10**n_digits - 1)
+        ranges.append(f"{start}-{end}")
+    return ",".join(ranges)
+
+
+def generate_day03(size: int, rng: random.Random) -> str:
+    """Generate `size` banks of 100 batteries."""
+    return "\n".join("".join(rng.choices("123456789", k=100)) for _ in range(size))
+
+
+def generate_day04(size: int, rng: random.Random) -> str:
+    """Generate a `size` x `size` grid of paper rolls."""
+    return "\n".join("".join("@" if rng.random() < 0.6 else "." for _ in range(size)) for _ in range(size))
+
+
+def generate_day05(size: int, rng: random.Random) -> str:
+    """Generate `size` fresh ingredient ID ranges followed by `size` available IDs."""
+    max_id = 600_000_000_000_000
+    ranges = []
+    for _ in range(size):
+        start = rng.randint(1, max_id)
+        ranges.append(f"{start}-{start + rng.randint(0, 10**13)}")
+    ids = [str(rng.randint(1, max_id)) for _ in range(size)]
+    return "\n".join(ranges) + "\n\n" + "\n".join(ids)
+
+
+def generate_day06(size: int, rng: random.Random, n_rows: int = 4) -> str:
+    """Generate a worksheet with `size` problems of `n_rows` numbers each."""
+    rows: list[list[str]] = [[] for _ in range(n_rows)]
+    operations = []
+    for problem in range(size):
+        # Each column is read top to bottom, so the rows holding a digit in it must be contiguous: sort
+        # the numbers by length. The first problem is widest on top, the worksheet must not start with
+        # blank columns as they would be lost when the input is stripped.
+        numbers = sorted((str(rng.randint(1, 9999)) for _ in range(n_rows)), key=len, reverse=True)
+        if problem > 0 and rng.random() < 0.5:
+            numbers.reverse()
+        width = max(len(number) for number in numbers)
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        for row, number in zip(rows, numbers, strict=True):
+            row.append(align(number, width))
+        operations.append(rng.choice("+*").ljust(width))
+    return "\n".join([*(" ".join(row) for row in rows), " ".join(operations).rstrip()])
+
+
+def generate_day07(size: int, rng: random.Random) -> str:
+    """Generate a tachyon manifold of `size` rows and (about) `size` columns.
+
+    Splitters are placed on every other row and are never next to each other.
+    """
+    n_cols = size | 1
+    lines = ["." * (n_cols // 2) + "S" + "." * (n_cols // 2)]
+    for row in range(1, size):
+        cells = ["."] * n_cols
+        if row % 2 == 0:
+            col = 1
+            while col < n_cols - 1:
+                if rng.random() < 0.3:
+                    cells[col] = "^"
+                    col += 2
+                else:
+                    col += 1
+        lines.append("".join(cells))
+    return "\n".join(lines)
+
+
+def generate_day08(size: int, rng: random.Random) -> str:
+    """Generate `size` distinct junction box positions."""
+    max_coord = max(100_000, size)
+    points: set[tuple[int, int, int]] = set()
+    while len(points) < size:
+        points.add((rng.randrange(max_coord), rng.randrange(max_coord), rng.randrange(max_coord)))
+    return "\n".join(f"{x},{y},{z}" for x, y, z in sorted(points, key=lambda _: rng.random()))
+
+
+def generate_day09(size: int, rng: random.Random) -> str:
+    """Generate a rectilinear polygon of about `size` red tiles (rounded down to a multiple of 4).
+
+    The polygon is x-monotone: a skyline on top and an inverted skyline at the bottom.
+    """
+    n_steps = max(1, size // 4)
+    max_coord = max(100_000, 4 * n_steps)
+    xs = sorted(rng.sample(range(max_coord), n_steps + 1))
+    middle = max_coord // 2
+
+    def heights(low: int, high: int) -> list[int]:
+        values = [rng.randint(low, high)]
+        while len(values) < n_steps:
+            value = rng.randint(low, high)
+            if value != values[-1]:
+                values.append(value)
+        return values
+
+    tops = heights(middle + 1, max_coord)
+    bottoms = heights(0, middle - 1)
+
+    vertices = []
+    for i, top in enumerate(tops):
+        vertices += [(xs[i], top), (xs[i + 1], top)]
+    for i in reversed(range(n_steps)):
+        vertices += [(xs[i + 1], bottoms[i]), (xs[i], bottoms[i])]
+    return "\n".join(f"{x},{y}" for x, y in vertices)
+
+
+GENERATORS: dict[int, Generator] = {
+    1: generate_day01,
+    2: generate_day02,
+    3: generate_day03,
+    4: generate_day04,
+    5: generate_day05,
+    6: generate_day06,
+    7: generate_day07,
+    8: generate_day08,
+    9: generate_day09,
+}
+
+
+def generate_input(day: int, size: int, seed: int = 0) -> str:
+    """Generate a synthetic input for a day, always the same for the same size and seed."""
+    if day not in GENERATORS:
+        raise ValueError(day)
+    if size < 1:
+        raise ValueError(size)
+    return GENERATORS[day](size, random.Random(seed)) + "\n"  # noqa: S311
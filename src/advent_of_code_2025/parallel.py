@@ -0,0 +1,64 @@
+"""Helpers to share data with worker processes."""
+
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from multiprocessing.shared_memory import SharedMemory
+
+INT_TYPECODE = "q"
+
+
+@contextmanager
+def shared_bytes(data: bytes | bytearray) -> Iterator[str]:
+    """Copy bytes into a shared memory block and yield its name, unlinking the block afterwards."""
+    shm = SharedMemory(create=True, size=max(len(data), 1))
+    try:
+        shm.buf[: len(data)] = data
+        yield shm.name
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+@contextmanager
+def shared_ints(values: Sequence[int]) -> Iterator[str]:
+    """Copy integers into a shared memory block and yield its name, unlinking the block afterwards."""
+    with shared_bytes(array(INT_TYPECODE, values).tobytes()) as name:
+        yield name
+
+
+def _attach(name: str) -> SharedMemory:
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    # Workers share the resource tracker of the process that created the block, so attaching registers
+    # the same name again and the creator's unlink still clears it
+    return SharedMemory(name=name)
+
+
+def read_shared_bytes(name: str, start: int, stop: int) -> bytes:
+    """Read a slice of a shared memory block created by `shared_bytes`."""
+    shm = _attach(name)
+    try:
+        return bytes(shm.buf[start:stop])
+    finally:
+        shm.close()
+
+
+def write_shared_bytes(name: str, start: int, data: bytes | bytearray) -> None:
+    """Overwrite part of a shared memory block created by `shared_bytes`."""
+    shm = _attach(name)
+    try:
+        shm.buf[start : start + len(data)] = data
+    finally:
+        shm.close()
+
+
+def read_shared_ints(name: str, start: int, stop: int) -> list[int]:
+    """Read a slice of the integers in a shared memory block created by `shared_ints`."""
+    shm = _attach(name)
+    try:
+        with shm.buf.cast(INT_TYPECODE) as view, view[start:stop] as values:
+            return values.tolist()
+    finally:
+        shm.close()
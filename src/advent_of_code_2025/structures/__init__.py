@@ -0,0 +1 @@
+"""Data structures shared by the solutions."""
@@ -0,0 +1,103 @@
+"""Rectangular grids of single-character cells."""
+
+from collections.abc import Iterator
+
+ORTHOGONAL = ((-1, 0), (0, -1), (0, 1), (1, 0))
+DIAGONAL = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+class ByteGrid:
+    """Grid of one-byte cells stored row-major in a single bytearray.
+
+    With a `border`, the grid is surrounded by a ring of that character, so the neighbours of any
+    cell in the grid can be read through flat offsets without bounds checks. Cells are addressed by
+    flat index (see `index`) or by (row, col).
+    """
+
+    def __init__(self, cells: bytearray, n_rows: int, n_cols: int, border: int | None = None) -> None:
+        pad = 0 if border is None else 1
+        self.cells = cells
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        self.border = border
+        self.stride = n_cols + 2 * pad
+        self.offset = pad * (self.stride + 1)
+        self._neighbour_offsets: dict[bool, tuple[int, ...]] = {}
+        if len(cells) != (n_rows + 2 * pad) * self.stride:
+            raise ValueError()
+
+    @classmethod
+    def from_text(cls, text: str, border: str | None = None) -> "ByteGrid":
+        """Build a grid from lines of equal length, optionally surrounded by a `border` character."""
+        lines = text.encode().splitlines()
+        n_rows = len(lines)
+        n_cols = len(lines[0]) if n_rows > 0 else 0
+        if any(len(line) != n_cols for line in lines):
+            raise ValueError()
+        if border is None:
+            return cls(bytearray().join(lines), n_rows, n_cols)
+
+        pad = border.encode()
+        padding_row = pad * (n_cols + 2)
+        cells = bytearray().join([padding_row, *(pad + line + pad for line in lines), padding_row])
+        return cls(cells, n_rows, n_cols, ord(border))
+
+    def copy(self) -> "ByteGrid":
+        """Get a copy of the grid that can be modified independently."""
+        return ByteGrid(self.cells.copy(), self.n_rows, self.n_cols, self.border)
+
+    def index(self, row: int, col: int) -> int:
+        """Get the flat index of the cell at (row, col)."""
+        return self.offset + row * self.stride + col
+
+    def position(self, index: int) -> tuple[int, int]:
+        """Get the (row, col) of a flat index."""
+        row, col = divmod(index - self.offset, self.stride)
+        return row, col
+
+    def in_grid(self, row: int, col: int) -> bool:
+        """Check if (row, col) is inside the grid, the border excluded."""
+        return 0 <= row < self.n_rows and 0 <= col < self.n_cols
+
+    def get(self, row: int, col: int) -> str | None:
+        """Get the cell value at (row, col), or None outside the grid."""
+        if not self.in_grid(row, col):
+            return None
+        return chr(self.cells[self.index(row, col)])
+
+    def set(self, row: int, col: int, value: str) -> None:
+        """Set the cell value at (row, col)."""
+        if not self.in_grid(row, col):
+            raise IndexError((row, col))
+        self.cells[self.index(row, col)] = ord(value)
+
+    def row(self, row: int) -> bytes:
+        """Get the cells of a row, the border excluded."""
+        start = self.index(row, 0)
+        return bytes(self.cells[start : start + self.n_cols])
+
+    def rows(self) -> Iterator[bytes]:
+        """Iterate over the rows of the grid."""
+        for row in range(self.n_rows):
+            yield self.row(row)
+
+    def indices(self) -> Iterator[int]:
+        """Iterate over the flat indices of all cells in the grid, row by row."""
+        for row in range(self.n_rows):
+            start = self.index(row, 0)
+            yield from range(start, start + self.n_cols)
+
+    def find(self, value: str) -> tuple[int, int] | None:
+        """Get the (row, col) of the first cell holding `value`, or None."""
+        for row in range(self.n_rows):
+            col = self.row(row).find(value.encode())
+            if col >= 0:
+                return row, col
+        return None
+
+    def neighbour_offsets(self, diagonal: bool = True) -> tuple[int, ...]:
+        """Get the flat index offsets of a cell's neighbours, in reading order."""
+        if diagonal not in self._neighbour_offsets:
+            directions = sorted((*ORTHOGONAL, *DIAGONAL)) if diagonal else ORTHOGONAL
+            self._neighbour_offsets[diagonal] = tuple(d_row * self.stride + d_col for d_row, d_col in directions)
+        return self._neighbour_offsets[diagonal]
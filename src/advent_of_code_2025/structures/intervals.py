@@ -0,0 +1,103 @@
+"""Sorted, disjoint integer intervals with fast membership queries."""
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+
+INT_TYPECODE = "q"
+FILE_MAGIC = b"IVX1"
+# Magic bytes and number of intervals, followed by all starts then all ends as little-endian int64
+FILE_HEADER = struct.Struct("<4sq")
+
+
+class IntervalIndex:
+    """Closed intervals `start..end`, merged and kept sorted in two parallel integer arrays.
+
+    Membership is a binary search over the starts. The index can be saved to a binary file and loaded
+    back, optionally through a memory map so a large index is not copied into memory.
+    """
+
+    def __init__(self, starts: Sequence[int], ends: Sequence[int]) -> None:
+        if len(starts) != len(ends):
+            raise ValueError()
+        self.starts = starts
+        self.ends = ends
+        self._mmap: mmap.mmap | None = None
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[tuple[int, int]]) -> "IntervalIndex":
+        """Build an index from closed ranges, merging the overlapping ones."""
+        starts = array(INT_TYPECODE)
+        ends = array(INT_TYPECODE)
+        for start, end in sorted(ranges):
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        return cls(starts, ends)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self.starts, self.ends, strict=True)
+
+    def __contains__(self, number: int) -> bool:
+        idx = bisect_right(self.starts, number) - 1
+        return idx >= 0 and number <= self.ends[idx]
+
+    def contains_many(self, numbers: Iterable[int]) -> list[bool]:
+        """Check which numbers are within an interval."""
+        return [number in self for number in numbers]
+
+    def count_contained(self, numbers: Iterable[int]) -> int:
+        """Count the numbers that are within an interval."""
+        return sum(number in self for number in numbers)
+
+    def total_length(self) -> int:
+        """Get the number of integers covered by the intervals."""
+        return sum(end - start + 1 for start, end in self)
+
+    def save(self, path: Path) -> None:
+        """Write the index to a binary file."""
+        starts, ends = array(INT_TYPECODE, self.starts), array(INT_TYPECODE, self.ends)
+        if sys.byteorder == "big":
+            starts.byteswap()
+            ends.byteswap()
+        with path.open("wb") as file:
+            file.write(FILE_HEADER.pack(FILE_MAGIC, len(starts)))
+            file.write(starts.tobytes())
+            file.write(ends.tobytes())
+
+    @classmethod
+    def load(cls, path: Path, use_mmap: bool = False) -> "IntervalIndex":
+        """Read an index written by `save`, either into memory or through a read-only memory map."""
+        with path.open("rb") as file:
+            magic, n_intervals = FILE_HEADER.unpack(file.read(FILE_HEADER.size))
+            if magic != FILE_MAGIC:
+                raise ValueError(path)
+            n_bytes = n_intervals * array(INT_TYPECODE).itemsize
+            if not use_mmap or sys.byteorder == "big" or n_intervals == 0:
+                starts, ends = array(INT_TYPECODE), array(INT_TYPECODE)
+                starts.frombytes(file.read(n_bytes))
+                ends.frombytes(file.read(n_bytes))
+                if sys.byteorder == "big":
+                    starts.byteswap()
+                    ends.byteswap()
+                return cls(starts, ends)
+
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        start_offset = FILE_HEADER.size
+        index = cls(
+            view[start_offset : start_offset + n_bytes].cast(INT_TYPECODE),
+            view[start_offset + n_bytes : start_offset + 2 * n_bytes].cast(INT_TYPECODE),
+        )
+        # The memory map must outlive the views over it
+        index._mmap = mapped
+        return index
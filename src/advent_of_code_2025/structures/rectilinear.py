@@ -0,0 +1,146 @@
+"""Indexes over axis-aligned geometry."""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from heapq import merge
+from itertools import accumulate
+from math import inf
+
+Coord2d = tuple[int, int]
+
+
+class AxisSegments:
+    """Segments parallel to one axis, each at a position `pos` and spanning `lo..hi` along the axis.
+
+    A merge sort tree over the segments sorted by position keeps, in every node, the starts of its
+    segments in order and the running maximum of their ends, so a query takes O(log^2 n).
+    """
+
+    def __init__(self, segments: Iterable[tuple[int, int, int]]) -> None:
+        ordered = sorted(segments)
+        self.positions = [pos for pos, _, _ in ordered]
+        self.size = 1
+        while self.size < len(ordered):
+            self.size *= 2
+
+        spans: list[list[tuple[int, int]]] = [[] for _ in range(2 * self.size)]
+        for i, (_, lo, hi) in enumerate(ordered):
+            spans[self.size + i] = [(lo, hi)]
+        for node in reversed(range(1, self.size)):
+            spans[node] = list(merge(spans[2 * node], spans[2 * node + 1]))
+        self.starts = [[lo for lo, _ in node_spans] for node_spans in spans]
+        self.max_ends = [list(accumulate((hi for _, hi in node_spans), max)) for node_spans in spans]
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def _node_overlaps(self, node: int, lo: int, hi: int) -> bool:
+        n_before = bisect_left(self.starts[node], hi)
+        return n_before > 0 and self.max_ends[node][n_before - 1] > lo
+
+    def any_crossing(self, pos_lo: int, pos_hi: int, lo: int, hi: int) -> bool:
+        """Check if a segment lies strictly between `pos_lo` and `pos_hi` and overlaps the open span `lo..hi`."""
+        left = bisect_right(self.positions, pos_lo) + self.size
+        right = bisect_left(self.positions, pos_hi) + self.size
+        while left < right:
+            if left & 1:
+                if self._node_overlaps(left, lo, hi):
+                    return True
+                left += 1
+            if right & 1:
+                right -= 1
+                if self._node_overlaps(right, lo, hi):
+                    return True
+            left //= 2
+            right //= 2
+        return False
+
+
+class EdgeIndex:
+    """Horizontal and vertical segments, indexed to find the ones crossing the inside of a rectangle."""
+
+    def __init__(self, segments: Iterable[tuple[Coord2d, Coord2d]]) -> None:
+        vertical = []
+        horizontal = []
+        for (x1, y1), (x2, y2) in segments:
+            if x1 == x2:
+                vertical.append((x1, min(y1, y2), max(y1, y2)))
+            elif y1 == y2:
+                horizontal.append((y1, min(x1, x2), max(x1, x2)))
+            else:
+                raise ValueError()
+        self.vertical = AxisSegments(vertical)
+        self.horizontal = AxisSegments(horizontal)
+
+    @classmethod
+    def from_polygon(cls, polygon: list[Coord2d]) -> "EdgeIndex":
+        """Index the edges between consecutive vertices of a closed polygon."""
+        return cls(zip(polygon, [*polygon[1:], polygon[0]], strict=True))
+
+    def crosses_interior(self, corner_1: Coord2d, corner_2: Coord2d) -> bool:
+        """Check if any segment intersects the open interior of the rectangle with the given corners."""
+        min_x, max_x = sorted((corner_1[0], corner_2[0]))
+        min_y, max_y = sorted((corner_1[1], corner_2[1]))
+        return self.vertical.any_crossing(min_x, max_x, min_y, max_y) or self.horizontal.any_crossing(
+            min_y, max_y, min_x, max_x
+        )
+
+
+class PointLocator:
+    """Point-in-polygon queries on a rectilinear polygon, by slab decomposition.
+
+    The plane is cut into horizontal slabs at the vertices' y-coordinates, and every slab keeps the
+    sorted x-coordinates of the vertical edges spanning it. A point is inside when it lies on an edge or
+    has an odd number of those edges to its right (crossing rule: vertical edges include their lower
+    end and exclude their upper end). Queries take O(log n), the slabs O(n^2) memory at worst.
+    """
+
+    def __init__(self, polygon: list[Coord2d]) -> None:
+        self.slab_ys = sorted({y for _, y in polygon})
+        self.slab_xs: list[list[int]] = [[] for _ in self.slab_ys]
+        vertical: dict[int, list[tuple[int, int]]] = {}
+        horizontal: dict[int, list[tuple[int, int]]] = {}
+        for (x1, y1), (x2, y2) in zip(polygon, [*polygon[1:], polygon[0]], strict=True):
+            if x1 == x2:
+                lo, hi = sorted((y1, y2))
+                vertical.setdefault(x1, []).append((lo, hi))
+                for slab in range(bisect_left(self.slab_ys, lo), bisect_left(self.slab_ys, hi)):
+                    self.slab_xs[slab].append(x1)
+            elif y1 == y2:
+                lo, hi = sorted((x1, x2))
+                horizontal.setdefault(y1, []).append((lo, hi))
+            else:
+                raise ValueError()
+        for xs in self.slab_xs:
+            xs.sort()
+        self.vertical = {x: sorted(spans) for x, spans in vertical.items()}
+        self.horizontal = {y: sorted(spans) for y, spans in horizontal.items()}
+
+    @staticmethod
+    def _in_spans(spans: list[tuple[int, int]] | None, value: int) -> bool:
+        if spans is None:
+            return False
+        # Edges of a simple polygon on the same line do not overlap, so only the last one starting at or
+        # before the value can contain it
+        idx = bisect_right(spans, (value, inf)) - 1
+        return idx >= 0 and spans[idx][0] <= value <= spans[idx][1]
+
+    def on_boundary(self, point: Coord2d) -> bool:
+        """Check if a point lies on an edge of the polygon."""
+        x, y = point
+        return self._in_spans(self.vertical.get(x), y) or self._in_spans(self.horizontal.get(y), x)
+
+    def contains(self, point: Coord2d) -> bool:
+        """Check if a point is inside or on the polygon."""
+        if self.on_boundary(point):
+            return True
+        x, y = point
+        slab = bisect_right(self.slab_ys, y) - 1
+        if slab < 0:
+            return False
+        xs = self.slab_xs[slab]
+        return (len(xs) - bisect_right(xs, x)) % 2 == 1
+
+    def contains_many(self, points: Iterable[Coord2d]) -> list[bool]:
+        """Check which points are inside or on the polygon."""
+        return [self.contains(point) for point in points]
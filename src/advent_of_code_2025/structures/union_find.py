@@ -0,0 +1,58 @@
+"""Union-Find (disjoint sets) over integer indices."""
+
+from array import array
+from collections.abc import Iterable
+
+
+class UnionFind:
+    """Disjoint sets of the indices `0..n-1`, stored in flat integer arrays.
+
+    `find` uses path halving, so it never recurses, and `union` attaches the smaller set to the larger
+    one while keeping track of every set's size and of the number of sets.
+    """
+
+    def __init__(self, n_items: int) -> None:
+        """Initialize every index in its own set."""
+        self.parent = array("i", range(n_items))
+        self.size = array("i", [1]) * n_items
+        self.n_components = n_items
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, item: int) -> int:
+        """Find the root of the set containing the item."""
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, item_1: int, item_2: int) -> bool:
+        """Union the sets containing item_1 and item_2, return whether they were separate."""
+        root_1 = self.find(item_1)
+        root_2 = self.find(item_2)
+        if root_1 == root_2:
+            return False
+
+        if self.size[root_1] < self.size[root_2]:
+            root_1, root_2 = root_2, root_1
+        self.parent[root_2] = root_1
+        self.size[root_1] += self.size[root_2]
+        self.n_components -= 1
+        return True
+
+    def union_many(self, pairs: Iterable[tuple[int, int]]) -> int:
+        """Union every pair of items and return how many sets were merged."""
+        n_components = self.n_components
+        for item_1, item_2 in pairs:
+            self.union(item_1, item_2)
+        return n_components - self.n_components
+
+    def component_size(self, item: int) -> int:
+        """Get the size of the set containing the item."""
+        return self.size[self.find(item)]
+
+    def component_sizes(self) -> list[int]:
+        """Get the sizes of all sets."""
+        return [size for item, (parent, size) in enumerate(zip(self.parent, self.size, strict=True)) if parent == item]
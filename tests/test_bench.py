@@ -0,0 +1,70 @@
+"""Tests for the benchmark timings."""
+
+import gc
+
+import pytest
+
+from advent_of_code_2025.commands.bench import TimingStats, time_calls, with_workers
+
+
+def test_timing_stats_from_samples():
+    """Test the summary of 20 timings, whose 95th percentile is the 19th smallest."""
+    stats = TimingStats.from_samples([float(i) for i in range(20, 0, -1)])
+    assert (stats.rounds, stats.minimum, stats.median, stats.p95, stats.mean) == (20, 1.0, 10.5, 19.0, 10.5)
+    assert stats.stddev == pytest.approx(5.9161, abs=1e-4)
+
+
+def test_timing_stats_from_one_sample():
+    """Test a single timing is every statistic and has no deviation."""
+    assert TimingStats.from_samples([0.5]) == TimingStats(1, 0.5, 0.5, 0.5, 0.5, 0.0)
+    with pytest.raises(ValueError):
+        TimingStats.from_samples([])
+
+
+@pytest.mark.parametrize("gc_enabled", [True, False])
+def test_time_calls_restores_gc(gc_enabled):
+    """Test the garbage collector is off while timing and back to its previous state afterwards."""
+    states = []
+
+    def func(n):
+        states.append(gc.isenabled())
+        return n * 2
+
+    was_enabled = gc.isenabled()
+    try:
+        if not gc_enabled:
+            gc.disable()
+        result, samples = time_calls(func, 21, rounds=3, warmup=2)
+        assert gc.isenabled() == gc_enabled
+    finally:
+        if was_enabled:
+            gc.enable()
+    assert result == 42
+    assert len(samples) == 3
+    assert states == [gc_enabled] * 2 + [False] * 3
+
+
+def test_time_calls_restores_gc_on_error():
+    """Test the garbage collector is enabled again when the timed call raises."""
+
+    def func():
+        raise RuntimeError()
+
+    assert gc.isenabled()
+    with pytest.raises(RuntimeError):
+        time_calls(func, rounds=1)
+    assert gc.isenabled()
+
+
+def test_with_workers():
+    """Test the worker count is only bound to solutions that take one."""
+
+    def parallel_solver(parsed, workers=None):
+        return parsed, workers
+
+    def solver(parsed):
+        return parsed
+
+    assert with_workers(solver, None) is solver
+    assert with_workers(solver, 2) is None
+    assert with_workers(parallel_solver, 2)("grid") == ("grid", 2)
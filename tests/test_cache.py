@@ -0,0 +1,83 @@
+"""Tests for the answer cache."""
+
+import os
+
+import pytest
+
+from advent_of_code_2025.commands import cache
+
+
+@pytest.fixture
+def cache_dirs(tmp_path, monkeypatch):
+    """Point the cache and the solution sources to temporary directories."""
+    src_dir = tmp_path / "src"
+    (src_dir / "structures").mkdir(parents=True)
+    (src_dir / "day01.py").write_text("def solve_part1(parsed):\n    return 1\n")
+    (src_dir / "structures" / "grid.py").write_text("class Grid:\n    pass\n")
+    (src_dir / "parallel.py").write_text("def shared_bytes():\n    pass\n")
+    (src_dir / "day02.py").write_text("def solve_part1(parsed):\n    return 2\n")
+    (src_dir / "commands").mkdir()
+    (src_dir / "commands" / "run.py").write_text("def run_day():\n    pass\n")
+    monkeypatch.setattr(cache, "SRC_DIR", src_dir)
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+    return src_dir
+
+
+def test_answer_key_changes_with_source(cache_dirs):
+    """Test editing the solution, a shared data structure or a helper module changes the key."""
+    key = cache.answer_key(1, 1, "abc")
+    assert cache.answer_key(1, 1, "abc") == key
+
+    (cache_dirs / "day01.py").write_text("def solve_part1(parsed):\n    return 2\n")
+    edited_key = cache.answer_key(1, 1, "abc")
+    assert edited_key != key
+
+    (cache_dirs / "structures" / "grid.py").write_text("class Grid:\n    size = 0\n")
+    structure_key = cache.answer_key(1, 1, "abc")
+    assert structure_key != edited_key
+
+    (cache_dirs / "parallel.py").write_text("def shared_bytes():\n    return None\n")
+    assert cache.answer_key(1, 1, "abc") != structure_key
+
+
+def test_answer_key_ignores_other_days_and_commands(cache_dirs):
+    """Test editing another day or a CLI command keeps the key."""
+    key = cache.answer_key(1, 1, "abc")
+    (cache_dirs / "day02.py").write_text("def solve_part1(parsed):\n    return 3\n")
+    (cache_dirs / "commands" / "run.py").write_text("def run_day():\n    return None\n")
+    assert cache.answer_key(1, 1, "abc") == key
+    assert [path.name for path in cache.solution_sources(1)] == ["day01.py", "parallel.py", "grid.py"]
+
+
+def test_answer_key_changes_with_input_and_part(cache_dirs):
+    """Test another input or part gets another key."""
+    key = cache.answer_key(1, 1, "abc")
+    assert cache.answer_key(1, 1, "abd") != key
+    assert cache.answer_key(1, 2, "abc") != key
+
+
+def test_store_and_get_answer(cache_dirs):
+    """Test a stored answer is returned and a missing one is a cache miss."""
+    key = cache.answer_key(1, 1, "abc")
+    assert cache.get_answer(key) is None
+
+    cache.store_answer(key, "42", 0.5)
+    assert cache.get_answer(key) == cache.CachedAnswer("42", 0.5)
+    assert cache.get_answer(cache.answer_key(1, 2, "abc")) is None
+
+
+def test_evict_keeps_most_recently_used(cache_dirs):
+    """Test the cache never holds more than `max_entries` and drops the least recently used first."""
+    keys = [cache.answer_key(1, 1, str(i)) for i in range(5)]
+    for i, key in enumerate(keys):
+        cache.store_answer(key, str(i), 0.0, max_entries=3)
+        os.utime(cache.CACHE_DIR / f"{key}.json", ns=(i * 10**9, i * 10**9))
+    assert len(list(cache.CACHE_DIR.glob("*.json"))) == 3
+    assert [cache.get_answer(key) is not None for key in keys] == [False, False, True, True, True]
+
+    # Reading an entry makes it the most recently used
+    for i, key in enumerate(keys[2:]):
+        os.utime(cache.CACHE_DIR / f"{key}.json", ns=(i * 10**9, i * 10**9))
+    assert cache.get_answer(keys[2]) is not None
+    cache.store_answer(keys[0], "0", 0.0, max_entries=3)
+    assert [cache.get_answer(key) is not None for key in keys] == [True, False, True, False, True]
@@ -0,0 +1,22 @@
+"""Tests for the helpers shared by the CLI commands."""
+
+import pytest
+
+from advent_of_code_2025.commands.common import hash_input, hash_input_file, iter_input_lines
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+@pytest.mark.parametrize("chunk_size", [1, 2, 1 << 20])
+def test_hash_input_file_matches_hash_input(tmp_path, newline, chunk_size):
+    """Test a file hashes like its contents, whatever its line endings and the chunk size."""
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(newline.join(["1,2", "34,5", ""]).encode())
+    assert hash_input_file(input_file, chunk_size) == hash_input(input_file.read_text()) == hash_input("1,2\n34,5\n")
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_iter_input_lines(tmp_path, use_mmap):
+    """Test lines are yielded without their line endings."""
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(b"1,2\r\n34,5\n6")
+    assert list(iter_input_lines(input_file, use_mmap)) == ["1,2", "34,5", "6"]
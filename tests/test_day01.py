@@ -8,3 +8,8 @@ def test_parse_input():
     input_data = test_file.load()
     parsed = day01.parse_input(input_data)
     assert parsed == [-10, 20, -1, 5]
+
+
+def test_parse_lines():
+    lines = iter(["L10", "", "R20"])
+    assert list(day01.parse_lines(lines)) == [-10, 20]
@@ -3,17 +3,14 @@
 from helpers import load_file
 
 from advent_of_code_2025 import day04
+from advent_of_code_2025.generators import generate_input
 
 
 def test_parse_input():
     """Test parsing the input data."""
     input_data = load_file(day=4)
     parsed = day04.parse_input(input_data)
-    assert parsed.data == [
-        [".", "@", "."],
-        ["@", "@", "@"],
-        [".", "@", "@"],
-    ]
+    assert list(parsed.rows()) == [b".@.", b"@@@", b".@@"]
     assert parsed.n_rows == 3
     assert parsed.n_cols == 3
 
@@ -30,3 +27,18 @@ def test_part2_example():
     input_data = load_file(day=4)
     result = day04.part2(input_data)
     assert result == 6
+
+
+def test_neighbour_counts():
+    """Test counting the adjacent rolls of every cell."""
+    grid = day04.parse_input(load_file(day=4))
+    counts = day04.neighbour_counts(grid)
+    assert [counts[grid.index(row, col)] for row in range(3) for col in range(3)] == [3, 3, 3, 3, 5, 4, 3, 4, 3]
+
+
+def test_parallel_bands():
+    """Test solving in bands of rows across worker processes gives the same answers."""
+    grid = day04.parse_input(generate_input(4, size=30, seed=1))
+    assert day04.solve_part1(grid, workers=3) == day04.solve_part1(grid)
+    assert day04.solve_part2(grid, workers=3) == day04.solve_part2(grid)
+    assert day04.part2(load_file(day=4), workers=2) == day04.part2(load_file(day=4))
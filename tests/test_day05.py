@@ -9,8 +9,8 @@ from advent_of_code_2025 import day05
 def test_parse_input():
     """Test parsing the input data."""
     input_data = load_file(day=5)
-    ranges, numbers = day05.parse_input(input_data)
-    assert ranges == [(1, 3), (20, 30), (4, 5), (100, 200), (15, 25)]
+    index, numbers = day05.parse_input(input_data)
+    assert list(index) == [(1, 3), (4, 5), (15, 30), (100, 200)]
     assert numbers == [1, 5, 150, 200, 75]
 
 
@@ -49,10 +49,11 @@ def test_merge_ranges(ranges: list[tuple[int, int]], expected: list[tuple[int, i
         "equal_end",
     ],
 )
-def test_is_number_in_ranges(number: int, ranges: list[tuple[int, int]], expected: bool) -> None:
-    corrected_ranges = [day05.Range(start, end) for start, end in ranges]
-    sorted_ranges = day05.merge_ranges(corrected_ranges)
-    assert day05.is_number_in_ranges(number, sorted_ranges) == expected
+def test_number_in_ranges(number: int, ranges: list[tuple[int, int]], expected: bool) -> None:
+    """Test checking if a number is in the parsed ranges."""
+    lines = [f"{start}-{end}" for start, end in ranges] + ["", str(number)]
+    index, _ = day05.parse_lines(lines)
+    assert (number in index) == expected
 
 
 def test_part1_example():
@@ -68,3 +69,12 @@ def test_part2_example():
     input_data = load_file(day=5)
     result = day05.part2(input_data)
     assert result == 122
+
+
+def test_parse_lines_reads_ids_lazily():
+    """Test that the IDs are only read from the lines when they are consumed."""
+    lines = iter(["1-3", "5-8", "", "2", "4", "6"])
+    index, numbers = day05.parse_lines(lines)
+    assert list(index) == [(1, 3), (5, 8)]
+    assert next(lines) == "2"
+    assert list(numbers) == [4, 6]
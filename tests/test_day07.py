@@ -12,7 +12,7 @@ def test_parse_input():
     assert grid.n_rows == 6
     assert grid.n_cols == 7
     assert start_point == day07.Point(row=0, col=3)
-    assert grid.get_cell(start_point) == "S"
+    assert grid.get(*start_point) == "S"
 
 
 def test_part1_example():
@@ -27,3 +27,10 @@ def test_part2_example():
     input_data = load_file(day=7)
     result = day07.part2(input_data)
     assert result == 4
+
+
+def test_part2_tall_manifold():
+    """Test counting timelines does not recurse on very tall manifolds."""
+    input_data = "..S..\n" + ".....\n..^..\n" * 10_000
+    assert day07.part1(input_data) == 1
+    assert day07.part2(input_data) == 2
@@ -1,8 +1,13 @@
 """Tests for day 8."""
 
+import random
+
+import pytest
 from helpers import load_file
 
 from advent_of_code_2025 import day08
+from advent_of_code_2025.generators import generate_input
+from advent_of_code_2025.structures.union_find import UnionFind
 
 
 def test_parse_input():
@@ -25,3 +30,73 @@ def test_part2_example():
     result = day08.part2(input_data)
     # TODO: Update with expected result from puzzle
     assert result == 44
+
+
+def test_k_closest_pairs():
+    """Test the k closest pairs are the start of the fully sorted pairs."""
+    points = day08.parse_input(generate_input(8, size=300, seed=1))
+    expected = day08.get_distances_sorted(points)
+    for k in (1, 10, 1000, len(expected)):
+        assert day08.k_closest_pairs(points, k) == expected[:k]
+
+
+def test_k_closest_pairs_parallel():
+    """Test the closest pairs searched by worker processes match the sequential search."""
+    points = day08.parse_input(generate_input(8, size=300, seed=6))
+    for k in (1, 500):
+        assert day08.k_closest_pairs(points, k, workers=2) == day08.k_closest_pairs(points, k)
+
+
+def test_k_closest_pairs_with_outlier(monkeypatch):
+    """Test a far away point does not make the search compare all pairs of a dense cluster."""
+    rng = random.Random(3)  # noqa: S311
+    points = list({(rng.randrange(40), rng.randrange(40), rng.randrange(40)) for _ in range(600)})
+    points.append((10**9, 10**9, 10**9))
+    expected = day08.get_distances_sorted(points)
+
+    n_distances = 0
+    squared_distance = day08.squared_distance
+
+    def counting_squared_distance(a, b):
+        nonlocal n_distances
+        n_distances += 1
+        return squared_distance(a, b)
+
+    monkeypatch.setattr(day08, "squared_distance", counting_squared_distance)
+    for k in (1, 100, 1000):
+        n_distances = 0
+        assert day08.k_closest_pairs(points, k) == expected[:k]
+        assert n_distances <= 2 * day08.CANDIDATES_PER_PAIR * (len(points) + k)
+
+
+def test_last_mst_edge():
+    """Test the last edge of the minimum spanning tree is the one Kruskal's algorithm adds last."""
+    points = day08.parse_input(generate_input(8, size=200, seed=2))
+    index = {point: idx for idx, point in enumerate(points)}
+    uf = UnionFind(len(points))
+    for _, point_a, point_b in day08.get_distances_sorted(points):
+        uf.union(index[point_a], index[point_b])
+        if uf.n_components == 1:
+            break
+    assert day08.last_mst_edge(points) == (point_a, point_b)
+
+
+def test_get_distances_sorted_parallel():
+    """Test the tiled edges computed by worker processes match the sequential ones."""
+    points = day08.parse_input(generate_input(8, size=150, seed=4))
+    expected = day08.get_distances_sorted(points)
+    assert day08.get_distances_sorted_parallel(points, workers=2, tile_size=40) == expected
+    assert day08.get_distances_sorted_parallel(points, k=100, workers=2, tile_size=40) == expected[:100]
+
+
+def test_get_distances_sorted_parallel_needs_k_for_large_inputs():
+    """Test all edges of a large input are never built at once."""
+    points = [(i, 0, 0) for i in range(day08.MAX_SORTED_POINTS + 1)]
+    with pytest.raises(ValueError):
+        day08.get_distances_sorted_parallel(points)
+
+
+def test_part1_with_workers():
+    """Test part 1 gets the same result with the closest pairs found by worker processes."""
+    input_data = generate_input(8, size=300, seed=5)
+    assert day08.part1(input_data, num_connections=200, workers=2) == day08.part1(input_data, num_connections=200)
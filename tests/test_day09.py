@@ -4,6 +4,7 @@ import pytest
 from helpers import load_file
 
 from advent_of_code_2025 import day09
+from advent_of_code_2025.generators import generate_input
 
 
 def test_parse_input():
@@ -33,6 +34,30 @@ def test_in_squared_polygon(point, expected):
     assert day09.in_squared_polygon(point, polygon) == expected
 
 
+def test_in_squared_polygon_through_vertex():
+    """Test tiles level with a reflex vertex, whose rightward ray runs along an edge."""
+    polygon = [day09.Point(*coords) for coords in [(0, 0), (10, 0), (10, 5), (5, 5), (5, 10), (0, 10)]]
+    assert day09.in_squared_polygon(day09.Point(2, 5), polygon)
+    assert day09.in_squared_polygon(day09.Point(2, 7), polygon)
+    assert not day09.in_squared_polygon(day09.Point(7, 7), polygon)
+    assert not day09.in_squared_polygon(day09.Point(11, 5), polygon)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_compressed_polygon_matches_point_locator(seed):
+    """Test every compressed cell holding tiles is outside exactly when its first tile is."""
+    polygon = day09.parse_input(generate_input(9, size=40, seed=seed))
+    compressed = day09.CompressedPolygon(polygon)
+    xs, ys = compressed.xs, compressed.ys
+    cols = [(c, xs[c // 2] + c % 2) for c in range(2 * len(xs) - 1) if c % 2 == 0 or xs[c // 2 + 1] - xs[c // 2] > 1]
+    rows = [(r, ys[r // 2] + r % 2) for r in range(2 * len(ys) - 1) if r % 2 == 0 or ys[r // 2 + 1] - ys[r // 2] > 1]
+    locator = day09.point_locator(tuple(polygon))
+    for r, y in rows:
+        inside = locator.contains_many((x, y) for _, x in cols)
+        outside = [compressed._count_outside(c, r, c, r) == 1 for c, _ in cols]
+        assert outside == [not is_inside for is_inside in inside]
+
+
 def test_part1_example():
     """Test part 1 with example input."""
     input_data = load_file(day=9)
@@ -46,3 +71,37 @@ def test_part2_example():
     result = day09.part2(input_data)
     # TODO: Update with expected result from puzzle
     assert result == 36
+
+
+def test_find_max_area_in_polygon_compressed():
+    """Test rectangles over the outside of a concave polygon are rejected."""
+    # A U shape: no polygon edge crosses the gap between its arms, yet the gap is outside
+    polygon = [
+        day09.Point(*coords)
+        for coords in [(0, 0), (100, 0), (100, 100), (99, 100), (99, 1), (1, 1), (1, 100), (0, 100)]
+    ]
+    compressed = day09.CompressedPolygon(polygon)
+    assert not compressed.contains_rectangle(day09.Point(1, 1), day09.Point(99, 100))
+    assert compressed.contains_rectangle(day09.Point(0, 0), day09.Point(100, 1))
+    assert day09.find_max_area_in_polygon_compressed(polygon) == 202
+    assert compressed.reach(day09.Point(1, 100)) == (0, 1, 0, 100)
+    assert compressed.reach(day09.Point(100, 0)) == (0, 100, 0, 100)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_find_max_area_in_polygon_compressed_matches_scan(seed):
+    """Test the search by area finds the largest of all the contained rectangles."""
+    polygon = day09.parse_input(generate_input(9, size=60, seed=seed))
+    compressed = day09.CompressedPolygon(polygon)
+    expected = max(
+        area for p1, p2, area in day09.get_all_rectangle_candidates(polygon) if compressed.contains_rectangle(p1, p2)
+    )
+    assert day09.find_max_area_in_polygon_compressed(polygon) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, day09.PARTNER_CHUNK_SIZE])
+def test_iter_rectangles_by_area(chunk_size):
+    """Test the lazy rectangle stream matches sorting every candidate."""
+    points = day09.parse_input(generate_input(9, size=40, seed=5))
+    expected = sorted(day09.get_all_rectangle_candidates(points), key=lambda x: x[2], reverse=True)
+    assert list(day09.iter_rectangles_by_area(points, chunk_size=chunk_size)) == expected
@@ -0,0 +1,38 @@
+"""Tests for the synthetic input generators."""
+
+import importlib
+
+import pytest
+
+from advent_of_code_2025.generators import GENERATORS, generate_input
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS))
+def test_generate_input_is_deterministic(day):
+    """Test the same seed gives the same input and another seed a different one."""
+    assert generate_input(day, size=20, seed=1) == generate_input(day, size=20, seed=1)
+    assert generate_input(day, size=20, seed=1) != generate_input(day, size=20, seed=2)
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS))
+def test_generated_input_is_solvable(day):
+    """Test both parts of a day run on a generated input."""
+    module = importlib.import_module(f"advent_of_code_2025.day{day:02d}")
+    input_data = generate_input(day, size=20, seed=0)
+    assert module.part1(input_data) is not None
+    assert module.part2(input_data) is not None
+
+
+def test_generate_day09_polygon_is_rectilinear():
+    """Test consecutive red tiles of the generated polygon share a row or a column."""
+    points = [tuple(map(int, line.split(","))) for line in generate_input(9, size=40, seed=3).splitlines()]
+    assert len(points) == 40
+    assert len(set(points)) == len(points)
+    for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1], strict=True):
+        assert (x1 == x2) != (y1 == y2)
+
+
+def test_generate_input_unknown_day():
+    """Test generating an input for a day without a generator."""
+    with pytest.raises(ValueError):
+        generate_input(25, size=10)
@@ -0,0 +1,39 @@
+"""Tests for the shared byte grid."""
+
+import pytest
+
+from advent_of_code_2025.structures.grid import ByteGrid
+
+
+def test_from_text():
+    """Test building a grid and reading its cells."""
+    grid = ByteGrid.from_text("ab\ncd\nef")
+    assert (grid.n_rows, grid.n_cols) == (3, 2)
+    assert grid.get(1, 0) == "c"
+    assert grid.get(3, 0) is None
+    assert list(grid.rows()) == [b"ab", b"cd", b"ef"]
+    assert grid.find("f") == (2, 1)
+
+
+def test_border():
+    """Test neighbours of edge cells read the border through flat offsets."""
+    grid = ByteGrid.from_text("@@\n@@", border=".")
+    corner = grid.index(0, 0)
+    assert sorted(chr(grid.cells[corner + offset]) for offset in grid.neighbour_offsets()) == [*".....@@@"]
+    assert [grid.position(index) for index in grid.indices()] == [(0, 0), (0, 1), (1, 0), (1, 1)]
+    assert grid.get(-1, 0) is None
+
+
+def test_copy_and_set():
+    """Test a copy is modified independently."""
+    grid = ByteGrid.from_text("ab")
+    copy = grid.copy()
+    copy.set(0, 1, "z")
+    assert grid.get(0, 1) == "b"
+    assert copy.get(0, 1) == "z"
+
+
+def test_uneven_lines():
+    """Test lines of different lengths are rejected."""
+    with pytest.raises(ValueError):
+        ByteGrid.from_text("abc\nde")
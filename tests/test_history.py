@@ -0,0 +1,68 @@
+"""Tests for the history of recorded results."""
+
+import json
+
+import pytest
+
+from advent_of_code_2025.commands import history
+from advent_of_code_2025.commands.history import Comparison, HistoryEntry
+
+
+@pytest.fixture
+def history_file(tmp_path, monkeypatch):
+    """Point the history file to a temporary directory."""
+    history_file = tmp_path / ".aoc" / "history.jsonl"
+    monkeypatch.setattr(history, "HISTORY_FILE", history_file)
+    return history_file
+
+
+def entry(seconds: float, answer: str = "42", part: int = 1, input_hash: str = "abc") -> HistoryEntry:
+    return HistoryEntry(day=1, part=part, answer=answer, seconds=seconds, input_hash=input_hash)
+
+
+def test_record_and_load_results(history_file):
+    """Test recorded entries are read back in order, with a timestamp."""
+    assert history.load_history() == []
+    history.record_results([entry(1.0), entry(2.0, part=2)])
+    history.record_results([entry(3.0)._replace(timestamp="2025-12-01T00:00:00+00:00")])
+    history.record_results([])
+
+    loaded = history.load_history()
+    assert [loaded_entry.seconds for loaded_entry in loaded] == [1.0, 2.0, 3.0]
+    assert all(loaded_entry.timestamp for loaded_entry in loaded)
+    assert loaded[2].timestamp == "2025-12-01T00:00:00+00:00"
+
+
+def test_load_history_skips_malformed_lines(history_file):
+    """Test truncated lines and lines of another format are skipped."""
+    history.record_results([entry(1.0)])
+    with history_file.open("a") as f:
+        f.write('{"day": 1, "part": 1, "ans\n')
+        f.write(json.dumps({"day": 1, "time": 2.0}) + "\n")
+        f.write("[1, 2]\n\n")
+    history.record_results([entry(3.0)])
+    assert [loaded_entry.seconds for loaded_entry in history.load_history()] == [1.0, 3.0]
+
+
+def test_compare_latest():
+    """Test the latest entry of each key is compared with the one recorded just before it."""
+    entries = [entry(1.0), entry(5.0, part=2), entry(2.0), entry(3.0, input_hash="def"), entry(4.0)]
+    assert history.compare_latest(entries) == [Comparison(previous=entry(2.0), latest=entry(4.0))]
+    assert history.compare_latest([entry(1.0, part=2), entry(2.0, part=2, answer="43")])[0].answer_changed
+
+
+@pytest.mark.parametrize(
+    ("previous", "latest", "expected"),
+    [
+        (1.0, 1.6, True),
+        (1.0, 1.4, False),
+        (1.0, 0.5, False),
+        # Large ratios of tiny timings are noise
+        (1e-4, 5e-4, False),
+        (1e-4, 2e-3, True),
+        (0.0, 1.0, False),
+    ],
+)
+def test_is_regression(previous, latest, expected):
+    """Test a regression needs both the slowdown ratio and an absolute slowdown of a millisecond."""
+    assert Comparison(previous=entry(previous), latest=entry(latest)).is_regression(1.5) == expected
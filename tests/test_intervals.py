@@ -0,0 +1,34 @@
+"""Tests for the shared interval index."""
+
+import pytest
+
+from advent_of_code_2025.structures.intervals import IntervalIndex
+
+
+def test_from_ranges():
+    """Test overlapping ranges are merged and membership is checked on the merged ones."""
+    index = IntervalIndex.from_ranges([(10, 20), (1, 3), (15, 25), (4, 5)])
+    assert list(index) == [(1, 3), (4, 5), (10, 25)]
+    assert index.contains_many([0, 1, 5, 6, 25, 26]) == [False, True, True, False, True, False]
+    assert index.count_contained([2, 7, 12]) == 2
+    assert index.total_length() == 21
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_save_and_load(tmp_path, use_mmap):
+    """Test an index saved to a file loads back the same."""
+    index = IntervalIndex.from_ranges([(1, 3), (2**40, 2**41), (-5, -1)])
+    index_file = tmp_path / "ranges.bin"
+    index.save(index_file)
+    loaded = IntervalIndex.load(index_file, use_mmap=use_mmap)
+    assert list(loaded) == list(index)
+    assert 2**40 + 7 in loaded
+    assert 0 not in loaded
+
+
+def test_load_rejects_other_files(tmp_path):
+    """Test loading a file that is not an index."""
+    other_file = tmp_path / "other.bin"
+    other_file.write_bytes(b"not an index at all")
+    with pytest.raises(ValueError):
+        IntervalIndex.load(other_file)
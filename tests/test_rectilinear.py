@@ -0,0 +1,58 @@
+"""Tests for the shared rectilinear geometry indexes."""
+
+import random
+
+from advent_of_code_2025.structures.rectilinear import EdgeIndex, PointLocator
+
+
+def crosses_interior_brute_force(segments, corner_1, corner_2):
+    min_x, max_x = sorted((corner_1[0], corner_2[0]))
+    min_y, max_y = sorted((corner_1[1], corner_2[1]))
+    return any(
+        min(x1, x2) < max_x and max(x1, x2) > min_x and min(y1, y2) < max_y and max(y1, y2) > min_y
+        for (x1, y1), (x2, y2) in segments
+    )
+
+
+def test_crosses_interior():
+    """Test the edge index against checking every segment."""
+    rng = random.Random(0)  # noqa: S311
+    segments = []
+    for _ in range(60):
+        pos, start, end = rng.randint(0, 30), rng.randint(0, 30), rng.randint(0, 30)
+        segments.append(((pos, start), (pos, end)) if rng.random() < 0.5 else ((start, pos), (end, pos)))
+    index = EdgeIndex(segments)
+    for _ in range(500):
+        corner_1 = (rng.randint(0, 30), rng.randint(0, 30))
+        corner_2 = (rng.randint(0, 30), rng.randint(0, 30))
+        assert index.crosses_interior(corner_1, corner_2) == crosses_interior_brute_force(segments, corner_1, corner_2)
+
+
+def test_from_polygon():
+    """Test a rectangle's edges only touch the boundary of the rectangle itself."""
+    polygon = [(0, 0), (5, 0), (5, 5), (0, 5)]
+    index = EdgeIndex.from_polygon(polygon)
+    assert not index.crosses_interior((0, 0), (5, 5))
+    assert index.crosses_interior((1, 1), (6, 6))
+    assert not index.crosses_interior((6, 6), (9, 9))
+
+
+def contains_brute_force(polygon, point):
+    x, y = point
+    crossings = 0
+    for (x1, y1), (x2, y2) in zip(polygon, [*polygon[1:], polygon[0]], strict=True):
+        if min(x1, x2) <= x <= max(x1, x2) and min(y1, y2) <= y <= max(y1, y2):
+            return True
+        if x1 == x2 and x < x1 and min(y1, y2) <= y < max(y1, y2):
+            crossings += 1
+    return crossings % 2 == 1
+
+
+def test_point_locator():
+    """Test the point locator against checking every edge."""
+    polygon = [(0, 0), (6, 0), (6, 2), (9, 2), (9, 7), (7, 7), (7, 4), (3, 4), (3, 8), (0, 8)]
+    locator = PointLocator(polygon)
+    points = [(x, y) for x in range(-1, 11) for y in range(-1, 10)]
+    assert locator.contains_many(points) == [contains_brute_force(polygon, point) for point in points]
+    assert locator.on_boundary((5, 4))
+    assert not locator.contains((5, 6))
@@ -0,0 +1,26 @@
+"""Tests for the scaling measurements."""
+
+import pytest
+
+from advent_of_code_2025.commands.scale import fit_exponent, format_bytes
+
+
+@pytest.mark.parametrize("exponent", [0.5, 1.0, 2.0, 3.0])
+def test_fit_exponent(exponent):
+    """Test the exponent of an exact power law is recovered."""
+    sizes = [10, 100, 1000, 10_000]
+    assert fit_exponent(sizes, [1e-6 * size**exponent for size in sizes]) == pytest.approx(exponent)
+
+
+@pytest.mark.parametrize(("sizes", "seconds"), [([100], [1.0]), ([100, 100], [1.0, 2.0]), ([10, 100], [1.0])])
+def test_fit_exponent_needs_two_sizes(sizes, seconds):
+    """Test fitting fails without two distinct sizes with a time each."""
+    with pytest.raises(ValueError):
+        fit_exponent(sizes, seconds)
+
+
+def test_format_bytes():
+    """Test sizes are formatted with the most readable unit."""
+    assert format_bytes(512) == "512B"
+    assert format_bytes(1536) == "1.5KiB"
+    assert format_bytes(3 * 1024**3) == "3.0GiB"
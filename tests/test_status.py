@@ -0,0 +1,100 @@
+"""Tests for the completion status."""
+
+from pathlib import Path
+
+import pytest
+
+from advent_of_code_2025.commands import status
+
+TEMPLATE = Path(status.__file__).parent.parent / "templates" / "solution.py.template"
+
+SOLVED_PART1 = '''"""Day 2: Solved"""
+
+
+def parse_input(input_data: str) -> list[int]:
+    return [int(line) for line in input_data.split()]
+
+
+def solve_part1(numbers: list[int]) -> int:
+    """Solve part 1 of day 2 from the parsed input."""
+    total = sum(numbers)
+    return total * 2
+
+
+def solve_part2(numbers: list[int]) -> int:
+    # TODO: Implement solution
+    return 0
+
+
+def part1(input_data: str) -> int:
+    return solve_part1(parse_input(input_data))
+
+
+def part2(input_data: str) -> int:
+    return solve_part2(parse_input(input_data))
+'''
+
+PARTS_ONLY = '''def part1(input_data: str) -> int:
+    """Solve part 1 of day 3."""
+    return len(input_data.split())
+
+
+def part2(input_data: str) -> int:
+    # TODO: Implement solution
+    return 0
+'''
+
+
+@pytest.fixture
+def day_file(tmp_path):
+    day_file = tmp_path / "day01.py"
+    day_file.write_text(TEMPLATE.read_text().format(day=1, day_padded="01", title="Stub"))
+    return day_file
+
+
+def test_scan_solution_file(tmp_path, day_file):
+    """Test stubs are not implemented, and `solve_partN` is checked rather than the `partN` wrapper."""
+    assert status.scan_solution_file(day_file) == (False, False)
+
+    solved = tmp_path / "day02.py"
+    solved.write_text(SOLVED_PART1)
+    assert status.scan_solution_file(solved) == (True, False)
+
+    parts_only = tmp_path / "day03.py"
+    parts_only.write_text(PARTS_ONLY)
+    assert status.scan_solution_file(parts_only) == (True, False)
+
+
+def test_status_index_rescans_changed_files(tmp_path, day_file, monkeypatch):
+    """Test a file is only scanned again once it changed, also across saved indexes."""
+    scanned = []
+    scan_solution_file = status.scan_solution_file
+
+    def counting_scan(path):
+        scanned.append(path.name)
+        return scan_solution_file(path)
+
+    monkeypatch.setattr(status, "scan_solution_file", counting_scan)
+    index_path = tmp_path / ".aoc" / "status_index.json"
+
+    index = status.StatusIndex(index_path)
+    assert index.parts_status(day_file) == (False, False)
+    assert index.parts_status(day_file) == (False, False)
+    index.save()
+    assert status.StatusIndex(index_path).parts_status(day_file) == (False, False)
+    assert scanned == ["day01.py"]
+
+    day_file.write_text(SOLVED_PART1)
+    index = status.StatusIndex(index_path)
+    assert index.parts_status(day_file) == (True, False)
+    assert scanned == ["day01.py", "day01.py"]
+
+    # Files that are gone are dropped from the saved index
+    other_file = tmp_path / "day02.py"
+    other_file.write_text(PARTS_ONLY)
+    index.parts_status(other_file)
+    index.save()
+    index = status.StatusIndex(index_path)
+    index.parts_status(day_file)
+    index.save()
+    assert set(status.StatusIndex(index_path).entries) == {"day01.py"}
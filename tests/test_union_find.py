@@ -0,0 +1,33 @@
+"""Tests for the shared Union-Find."""
+
+from advent_of_code_2025.structures.union_find import UnionFind
+
+
+def test_union():
+    """Test merging sets and tracking their sizes."""
+    uf = UnionFind(5)
+    assert uf.union(0, 1)
+    assert uf.union(1, 2)
+    assert not uf.union(2, 0)
+    assert uf.find(0) == uf.find(2)
+    assert uf.find(3) != uf.find(0)
+    assert uf.n_components == 3
+    assert uf.component_size(2) == 3
+    assert sorted(uf.component_sizes()) == [1, 1, 3]
+
+
+def test_union_many():
+    """Test merging a batch of pairs."""
+    uf = UnionFind(6)
+    assert uf.union_many([(0, 1), (2, 3), (1, 0), (3, 4)]) == 3
+    assert uf.n_components == 3
+    assert sorted(uf.component_sizes()) == [1, 2, 3]
+
+
+def test_long_chain():
+    """Test a long chain of unions does not recurse."""
+    n_items = 100_000
+    uf = UnionFind(n_items)
+    uf.union_many((item, item + 1) for item in range(n_items - 1))
+    assert uf.n_components == 1
+    assert uf.component_size(0) == n_items